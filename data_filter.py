@@ -11,25 +11,26 @@ class BusinessFilter:
     
     def __init__(self):
         # Define social media and booking platform domains
-        self.social_domains = [
+        self.social_domains = (
             'instagram.com', 'facebook.com', 'twitter.com', 'tiktok.com',
             'linkedin.com', 'youtube.com', 'snapchat.com', 'pinterest.com'
-        ]
+        )
         
         self.booking_platforms = {
-            'squarespace': ['squarespace.com', 'static1.squarespace.com', 'squareup.com'],
-            'booksy': ['booksy.com', 'booksy.biz'],
-            'acuity': ['acuityscheduling.com'],
-            'schedulicity': ['schedulicity.com'],
-            'vagaro': ['vagaro.com'],
-            'styleseat': ['styleseat.com']
+            # static1.squarespace.com is already matched by squarespace.com
+            'squarespace': ('squarespace.com', 'squareup.com'),
+            'booksy': ('booksy.com', 'booksy.biz'),
+            'acuity': ('acuityscheduling.com',),
+            'schedulicity': ('schedulicity.com',),
+            'vagaro': ('vagaro.com',),
+            'styleseat': ('styleseat.com',)
         }
         
         # Google/Maps domains to exclude
-        self.google_domains = [
+        self.google_domains = (
             'google.com', 'maps.google.com', 'googleusercontent.com',
             'gstatic.com', 'googleapis.com'
-        ]
+        )
         
         # Compiled regex patterns for better performance
         self.instagram_patterns = [
@@ -50,9 +51,10 @@ class BusinessFilter:
         
         # Booking keywords for faster matching
         self.booking_keywords = {
-            'squarespace': ['squarespace', 'square space', 'book online'],
-            'booksy': ['booksy', 'book with booksy'],
-            'general': ['book appointment', 'schedule online', 'online booking', 'appointment booking']
+            'squarespace': ('squarespace', 'square space', 'book online'),
+            # 'book with booksy' is already matched by 'booksy'
+            'booksy': ('booksy',),
+            'general': ('book appointment', 'schedule online', 'online booking', 'appointment booking')
         }
     
     def analyze_business(self, business_data: Dict) -> Dict:
@@ -177,9 +179,11 @@ class BusinessFilter:
     
     def _find_squarespace_links(self, description: str, website: str) -> Dict:
         """Find Squarespace booking links."""
-        # Check website first
-        if website and any(domain in website.lower() for domain in self.booking_platforms['squarespace']):
-            return {'found': True, 'link': website}
+        # Check website first (lowercased once, not once per domain)
+        if website:
+            website_lower = website.lower()
+            if any(domain in website_lower for domain in self.booking_platforms['squarespace']):
+                return {'found': True, 'link': website}
         
         # Check description for Squarespace keywords
         if description:
@@ -192,9 +196,11 @@ class BusinessFilter:
     
     def _find_booksy_links(self, description: str, website: str) -> Dict:
         """Find Booksy booking links."""
-        # Check website first
-        if website and any(domain in website.lower() for domain in self.booking_platforms['booksy']):
-            return {'found': True, 'link': website}
+        # Check website first (lowercased once, not once per domain)
+        if website:
+            website_lower = website.lower()
+            if any(domain in website_lower for domain in self.booking_platforms['booksy']):
+                return {'found': True, 'link': website}
         
         # Check description for Booksy keywords
         if description:
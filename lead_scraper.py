@@ -15,19 +15,31 @@ class LeadScraper:
     Complete lead generation solution that scrapes Google Maps and filters for qualified leads.
     """
     
-    def __init__(self, headless: bool = False, progress_callback=None):
+    def __init__(self, headless: bool = False, progress_callback=None, stop_event=None, workers: int = 1, tabs: int = 1,
+                 http_first: bool = False, delay_between_requests: float = 0.0, use_cache: bool = True,
+                 force_rescrape: bool = False, grid_url: str = None):
         """
         Initialize the lead scraper.
         
         Args:
             headless (bool): Whether to run browser in headless mode
             progress_callback: Optional callback function for progress updates
+            stop_event: Optional threading.Event that cancels a running search when set
+            workers (int): Number of browsers used to extract business pages in parallel
+            tabs (int): Number of tabs a single browser uses to overlap page loads
+            http_first (bool): Try a plain HTTP fetch of each business page before the browser
+            delay_between_requests (float): Optional minimum average seconds between business page loads
+            use_cache (bool): Reuse businesses extracted by recent runs instead of loading them again
+            force_rescrape (bool): Reload every business page even if it is cached
+            grid_url (str): Optional Selenium Grid hub URL to run the browsers on
         """
         self.progress_callback = progress_callback
         if self.progress_callback:
             self.progress_callback("Initializing browser...")
         
-        self.scraper = GoogleMapsScraper(headless=headless)
+        self.scraper = GoogleMapsScraper(headless=headless, stop_event=stop_event, workers=workers, tabs=tabs,
+                                         http_first=http_first, delay_between_requests=delay_between_requests,
+                                         use_cache=use_cache, force_rescrape=force_rescrape, grid_url=grid_url)
         self.filter = BusinessFilter()
         
         if self.progress_callback:
@@ -174,6 +186,10 @@ class LeadScraper:
             print(f"   • Booksy: {stats.get('booksy_count', 0)}")
             print(f"   • No online presence: {stats.get('no_presence_count', 0)}")
     
+    def is_alive(self) -> bool:
+        """Check whether the underlying browser session can be reused for another search."""
+        return self.scraper is not None and self.scraper._is_browser_connected()
+    
     def close(self):
         """Clean up resources."""
         if self.scraper:
@@ -10,8 +10,74 @@ import threading
 import time
 import csv
 import os
+import io
+import sys
+import queue
 from datetime import datetime
-from lead_scraper import LeadScraper
+
+
+# Initial window size, also used to center the window without a layout pass
+WINDOW_WIDTH = 800
+WINDOW_HEIGHT = 700
+
+# Number of Chrome instances that extract business pages concurrently
+PARALLEL_BROWSERS = 3
+
+# Column order for exported lead CSV files
+CSV_FIELDNAMES = [
+    'Business Name',
+    'Phone',
+    'Address',
+    'IG found?',
+    'Squarespace link found?',
+    'Booksy link found?',
+    'Qualification Reason',
+    'Notes'
+]
+
+
+def _csv_str(value):
+    """Pre-stringify a cell so the csv writer never has to introspect it."""
+    return str(value) if value is not None else ""
+
+
+class ProgressCapture(io.StringIO):
+    """Captures scraper output and mirrors key progress lines into the GUI."""
+    
+    def __init__(self, gui_instance):
+        super().__init__()
+        self.gui = gui_instance
+        self.buffer = ""
+    
+    def write(self, text):
+        super().write(text)
+        self.buffer += text
+        
+        # Update GUI with key progress indicators
+        if "🔍 Searching for:" in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Searching Google Maps..."))
+        elif "📍 Processing" in text and "businesses..." in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Found businesses - starting data extraction..."))
+        elif "📊 Processing" in text and "/" in text:
+            # Extract progress from "📊 Processing 5/20 - 25.0%"
+            try:
+                parts = text.split("Processing ")[1].split(" - ")[0]
+                current, total = parts.split("/")
+                progress = (int(current) / int(total)) * 100
+                self.gui.root.after(0, lambda p=progress: self.gui.progress.config(value=p))
+                self.gui.root.after(0, lambda: self.gui.status_var.set(f"Extracting business data... ({current}/{total})"))
+            except:
+                pass
+        elif "✅ Scraping completed!" in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Scraping completed - analyzing results..."))
+        elif "🔄 Attempting to restart browser session" in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Browser session lost - attempting recovery..."))
+        elif "✅ Browser session recovered" in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Browser session recovered - continuing..."))
+        elif "❌ Browser disconnected" in text:
+            self.gui.root.after(0, lambda: self.gui.status_var.set("Browser connection issue - attempting recovery..."))
+        
+        return len(text)
 
 
 class GoogleMapsLeadScraperGUI:
@@ -23,28 +89,63 @@ class GoogleMapsLeadScraperGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Google Maps Lead Scraper")
-        self.root.geometry("800x700")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.resizable(True, True)
         
         # Initialize variables
         self.scraper = None
         self.current_results = None
         self.is_searching = False
+        self.start_time = None
+        self._prewarmed = False
+        
+        # Import the Selenium-backed scraper stack while the user types
+        threading.Thread(target=self._warm_scraper_imports, daemon=True).start()
+        
+        # Persistent worker thread that runs queued searches one at a time
+        self._jobs = queue.Queue()
+        self._stop_event = threading.Event()
+        # Id of the newest submitted search; completions from older jobs leave the UI alone
+        self._job_id = 0
+        self._stopping = False
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        
+        # Keep the window hidden while widgets are built and positioned
+        self.root.wm_attributes("-alpha", 0.0)
         
         # Create the GUI
         self.create_widgets()
         
         # Center the window
         self.center_window()
+        self.root.wm_attributes("-alpha", 1.0)
+    
+    def _warm_scraper_imports(self):
+        """Pre-import the scraper modules so the first search doesn't pay for it."""
+        try:
+            import lead_scraper
+            self._prewarmed = True
+        except Exception:
+            pass
+    
+    def _worker_loop(self):
+        """Block on the job queue and run each submitted search."""
+        while True:
+            job_id, keyword, city, max_businesses = self._jobs.get()
+            self._stop_event.clear()
+            try:
+                self.run_search(keyword, city, max_businesses)
+            finally:
+                # Only now is the job really over, stopped or not
+                self.root.after(0, lambda: self.search_completed(job_id))
+                self._jobs.task_done()
     
     def center_window(self):
-        """Center the window on the screen."""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
+        """Center the window on the screen using the fixed initial size (no layout pass)."""
+        x = (self.root.winfo_screenwidth() // 2) - (WINDOW_WIDTH // 2)
+        y = (self.root.winfo_screenheight() // 2) - (WINDOW_HEIGHT // 2)
+        self.root.geometry(f'{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}')
     
     def create_widgets(self):
         """Create all GUI widgets."""
@@ -220,15 +321,16 @@ class GoogleMapsLeadScraperGUI:
             self.progress['value'] = progress
             
             # Calculate ETA if we have started processing
-            if hasattr(self, 'start_time') and current > 0:
-                elapsed = time.time() - self.start_time
+            if self.start_time is not None and current > 0:
+                elapsed = time.monotonic() - self.start_time
                 rate = current / elapsed  # businesses per second
                 remaining = total - current
                 eta_seconds = remaining / rate if rate > 0 else 0
                 
                 # Format ETA
                 if eta_seconds > 60:
-                    eta_str = f"{int(eta_seconds // 60)}m {int(eta_seconds % 60)}s"
+                    eta_min, eta_sec = divmod(int(eta_seconds), 60)
+                    eta_str = f"{eta_min}m {eta_sec}s"
                 else:
                     eta_str = f"{int(eta_seconds)}s"
                 
@@ -236,8 +338,6 @@ class GoogleMapsLeadScraperGUI:
                 self.status_var.set(f"{status} ({current}/{total}) - ETA: {eta_str}")
             else:
                 self.status_var.set(status)
-        
-        self.root.update_idletasks()
 
     def start_search(self):
         """Start the lead search process."""
@@ -253,6 +353,8 @@ class GoogleMapsLeadScraperGUI:
         
         # Update UI state
         self.is_searching = True
+        self._stopping = False
+        self._job_id += 1
         self.search_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.export_button.config(state=tk.DISABLED)
@@ -261,50 +363,65 @@ class GoogleMapsLeadScraperGUI:
         # Initialize progress tracking
         self.progress['value'] = 0
         self.status_var.set("Initializing search...")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self.root.update_idletasks()
         
-        # Start search in separate thread
-        search_thread = threading.Thread(target=self.run_search, daemon=True)
-        search_thread.start()
+        # Hand the search to the worker thread
+        self._jobs.put((
+            self._job_id,
+            self.keyword_var.get().strip(),
+            self.city_var.get().strip(),
+            int(self.max_businesses_var.get())
+        ))
     
-    def run_search(self):
-        """Run the search in a separate thread."""
+    def run_search(self, keyword, city, max_businesses):
+        """Run the search on the worker thread."""
         try:
-            keyword = self.keyword_var.get().strip()
-            city = self.city_var.get().strip()
-            max_businesses = int(self.max_businesses_var.get())
-            
             # Update status with more detailed progress
             self.root.after(0, lambda: self.status_var.set(f"Preparing to search for {keyword} in {city}..."))
             time.sleep(0.5)  # Brief pause for UI update
             
-            # Initialize scraper with progress feedback
-            self.root.after(0, lambda: self.status_var.set("Starting browser (this may take 30-60 seconds)..."))
-            self.root.after(0, lambda: self.progress.config(mode='indeterminate'))
-            self.root.after(0, lambda: self.progress.start(10))
-            
-            # Progress callback for browser initialization
-            def browser_progress(message):
-                self.root.after(0, lambda: self.status_var.set(message))
+            # Reuse the browser from the previous search while it is still alive
+            if self.scraper and not self.scraper.is_alive():
+                self._close_scraper()
             
-            # Initialize scraper with progress callback and error handling
-            try:
-                self.scraper = LeadScraper(headless=True, progress_callback=browser_progress)
-            except Exception as e:
-                # Handle browser startup failure
-                self.root.after(0, lambda: self.progress.stop())
-                self.root.after(0, lambda: self.progress.config(mode='determinate'))
-                self.root.after(0, lambda: self.progress.config(value=0))
+            if self.scraper is None:
+                # Initialize scraper with progress feedback
+                # The background pre-import may still be running if the user searched right away
+                startup_text = ("Starting browser (this may take 30-60 seconds)..." if self._prewarmed
+                                else "Loading scraper and starting browser (this may take 30-60 seconds)...")
+                self.root.after(0, lambda: self.status_var.set(startup_text))
+                self.root.after(0, lambda: self.progress.config(mode='indeterminate'))
+                self.root.after(0, lambda: self.progress.start(10))
                 
-                error_msg = str(e)
-                if "timed out" in error_msg.lower():
-                    error_msg = "Browser startup timed out. Please close any Chrome windows and try again."
-                elif "chrome" in error_msg.lower():
-                    error_msg = "Chrome browser failed to start. Please ensure Chrome is installed and try again."
+                # Progress callback for browser initialization
+                def browser_progress(message):
+                    self.root.after(0, lambda: self.status_var.set(message))
                 
-                self.root.after(0, lambda: messagebox.showerror("Browser Error", error_msg))
-                self.root.after(0, lambda: self.status_var.set("Browser failed to start"))
-                return
+                # Initialize scraper with progress callback and error handling
+                try:
+                    from lead_scraper import LeadScraper
+                    self.scraper = LeadScraper(
+                        headless=True,
+                        progress_callback=browser_progress,
+                        stop_event=self._stop_event,
+                        workers=PARALLEL_BROWSERS
+                    )
+                except Exception as e:
+                    # Handle browser startup failure
+                    self.root.after(0, lambda: self.progress.stop())
+                    self.root.after(0, lambda: self.progress.config(mode='determinate'))
+                    self.root.after(0, lambda: self.progress.config(value=0))
+                    
+                    error_msg = str(e)
+                    if "timed out" in error_msg.lower():
+                        error_msg = "Browser startup timed out. Please close any Chrome windows and try again."
+                    elif "chrome" in error_msg.lower():
+                        error_msg = "Chrome browser failed to start. Please ensure Chrome is installed and try again."
+                    
+                    self.root.after(0, lambda: messagebox.showerror("Browser Error", error_msg))
+                    self.root.after(0, lambda: self.status_var.set("Browser failed to start"))
+                    return
             
             # Stop indeterminate progress and switch to determinate
             self.root.after(0, lambda: self.progress.stop())
@@ -314,47 +431,6 @@ class GoogleMapsLeadScraperGUI:
             # Run the search with enhanced progress monitoring
             self.root.after(0, lambda: self.status_var.set("Browser ready - starting search..."))
             
-            # Enhanced output capture with real-time updates
-            import io
-            import sys
-            
-            # Create a custom output handler for real-time updates
-            class ProgressCapture(io.StringIO):
-                def __init__(self, gui_instance):
-                    super().__init__()
-                    self.gui = gui_instance
-                    self.buffer = ""
-                
-                def write(self, text):
-                    super().write(text)
-                    self.buffer += text
-                    
-                    # Update GUI with key progress indicators
-                    if "🔍 Searching for:" in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Searching Google Maps..."))
-                    elif "📍 Processing" in text and "businesses..." in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Found businesses - starting data extraction..."))
-                    elif "📊 Processing" in text and "/" in text:
-                        # Extract progress from "📊 Processing 5/20 - 25.0%"
-                        try:
-                            parts = text.split("Processing ")[1].split(" - ")[0]
-                            current, total = parts.split("/")
-                            progress = (int(current) / int(total)) * 100
-                            self.gui.root.after(0, lambda p=progress: self.gui.progress.config(value=p))
-                            self.gui.root.after(0, lambda: self.gui.status_var.set(f"Extracting business data... ({current}/{total})"))
-                        except:
-                            pass
-                    elif "✅ Scraping completed!" in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Scraping completed - analyzing results..."))
-                    elif "🔄 Attempting to restart browser session" in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Browser session lost - attempting recovery..."))
-                    elif "✅ Browser session recovered" in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Browser session recovered - continuing..."))
-                    elif "❌ Browser disconnected" in text:
-                        self.gui.root.after(0, lambda: self.gui.status_var.set("Browser connection issue - attempting recovery..."))
-                    
-                    return len(text)
-            
             # Capture output with real-time updates
             old_stdout = sys.stdout
             captured_output = ProgressCapture(self)
@@ -388,14 +464,18 @@ class GoogleMapsLeadScraperGUI:
                 user_message = f"An error occurred:\n{error_details}\n\nTry:\n• Different search terms\n• Checking your internet connection\n• Restarting the application"
             
             self.root.after(0, lambda: self.handle_search_error(user_message))
-        finally:
-            # Enhanced cleanup
-            if self.scraper:
-                try:
-                    self.scraper.close()
-                except:
-                    pass
-            self.root.after(0, self.search_completed)
+            
+            # Start from a fresh browser on the next search
+            self._close_scraper()
+    
+    def _close_scraper(self):
+        """Close the shared scraper and its browser, ignoring cleanup errors."""
+        if self.scraper:
+            try:
+                self.scraper.close()
+            except:
+                pass
+        self.scraper = None
     
     def display_results(self, results, output):
         """Display search results in the text area."""
@@ -487,14 +567,20 @@ Contact support if the problem persists.
     
     def stop_search(self):
         """Stop the current search."""
-        if self.scraper:
-            self.scraper.close()
-        self.is_searching = False
-        self.search_completed()
-        self.status_var.set("Search stopped by user")
+        # The scraper polls this event and winds down after the page it is on; the browser
+        # stays open for the next search. The UI is reset once the worker reports the job done
+        self._stop_event.set()
+        self._stopping = True
+        self.stop_button.config(state=tk.DISABLED)
+        self.status_var.set("Stopping - finishing the current page...")
     
-    def search_completed(self):
-        """Reset UI after search completion."""
+    def search_completed(self, job_id):
+        """Reset UI after the worker finished search job_id."""
+        if job_id != self._job_id:
+            return
+        if self._stopping:
+            self._stopping = False
+            self.status_var.set("Search stopped by user")
         self.is_searching = False
         self.progress.stop()
         self.search_button.config(state=tk.NORMAL)
@@ -539,42 +625,38 @@ Contact support if the problem persists.
     
     def save_to_csv(self, filename):
         """Save the qualified leads to a CSV file matching client requirements."""
+        rows = [self._lead_to_row(lead) for lead in self.current_results['qualified_leads']]
+        
+        # Render the whole file in memory and write it once
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(rows)
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Business Name',
-                'Phone',
-                'Address', 
-                'IG found?',
-                'Squarespace link found?',
-                'Booksy link found?',
-                'Qualification Reason',
-                'Notes'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for lead in self.current_results['qualified_leads']:
-                writer.writerow({
-                    'Business Name': lead['business_name'],
-                    'Phone': lead['phone'],
-                    'Address': lead['address'],
-                    'IG found?': 'Yes' if lead.get('instagram_found', False) else 'No',
-                    'Squarespace link found?': 'Yes' if lead.get('squarespace_found', False) else 'No',
-                    'Booksy link found?': 'Yes' if lead.get('booksy_found', False) else 'No',
-                    'Qualification Reason': lead['qualification_reason'],
-                    'Notes': lead.get('notes', '')
-                })
+            csvfile.write(buffer.getvalue())
+    
+    def _lead_to_row(self, lead):
+        """Convert a lead into a row of plain strings in CSV_FIELDNAMES order."""
+        return [
+            _csv_str(lead['business_name']),
+            _csv_str(lead['phone']),
+            _csv_str(lead['address']),
+            'Yes' if lead.get('instagram_found', False) else 'No',
+            'Yes' if lead.get('squarespace_found', False) else 'No',
+            'Yes' if lead.get('booksy_found', False) else 'No',
+            _csv_str(lead['qualification_reason']),
+            _csv_str(lead.get('notes', ''))
+        ]
     
     def on_closing(self):
         """Handle application closing."""
         if self.is_searching:
-            if messagebox.askokcancel("Quit", "Search is in progress. Do you want to quit?"):
-                if self.scraper:
-                    self.scraper.close()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("Quit", "Search is in progress. Do you want to quit?"):
+                return
+            self._stop_event.set()
+        
+        self._close_scraper()
+        self.root.destroy()
 
 
 def main():
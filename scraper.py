@@ -1,15 +1,743 @@
+import os
 import time
 import re
-from typing import List, Dict, Optional
+import sys
+import logging
+from html import unescape
+import queue
+import signal
+from collections import deque
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from typing import Iterator, List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-import random
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import json
+import sqlite3
+from functools import lru_cache
+from urllib.parse import unquote, urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is at emit time, so the GUI's output capture still sees progress."""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+# Browser and HTTP fast path present the same user agent
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+# Resources the scraper never reads; blocked at the network layer to cut page weight.
+# Stylesheets are deliberately left alone: the results feed needs them to be scrollable.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.mp4",
+    "*.woff", "*.woff2", "*.ttf",
+    # Map tiles, street view and photo hosts: the scraper only reads the details panel text
+    "*/maps/vt*", "*streetviewpixels*", "*googleusercontent.com/*",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    # Telemetry beacons that keep the page busy after the content has loaded
+    "*play.google.com/log*", "*gen_204*", "*clientstream.launchdarkly*"
+]
+
+
+# Reads every business field, description included, in one round-trip instead of one
+# WebDriver command per element. Written as a self-invoking expression so it can run
+# through CDP Runtime.evaluate.
+EXTRACT_FIELDS_JS = r"""
+(() => {
+    // Scroll the details panel once so lazily rendered sections start loading
+    const panel = document.querySelector("div[role='main']");
+    if (panel) panel.scrollTop = panel.scrollHeight;
+    const text = sel => { const el = document.querySelector(sel); return el ? el.innerText : null; };
+    const href = sel => { const el = document.querySelector(sel); return el ? el.href : null; };
+    const panelText = sel => { const el = panel ? panel.querySelector(sel) : null; return el ? el.innerText : null; };
+    // Phone from a tel: link in the details panel; the scheme prefix is dropped
+    const telHref = () => {
+        const a = panel ? panel.querySelector("a[href^='tel:']") : null;
+        return a ? decodeURIComponent(a.getAttribute("href").slice(4)) : null;
+    };
+    // Phone fallback: one regex pass over the details panel text when no phone element exists.
+    // A single alternation covers (555) 555-5555, 555-555-5555, 555.555.5555 and +1 prefixes
+    const phoneInText = () => {
+        const hit = panel ? panel.innerText.match(
+            /(?<!\d)(?:\+?1[-.\s]?)?(?:\(\d{3}\)\s?|\d{3}[-.\s])\d{3}[-.\s]?\d{4}(?!\d)/
+        ) : null;
+        return hit ? hit[0] : null;
+    };
+    // Description sources, in priority order; duplicates are dropped by the Set
+    const visible = el => el.getClientRects().length > 0;
+    const descriptionParts = () => {
+        const parts = new Set();
+        const selectors = [
+            ".PYvSYb",                     // Main description area
+            ".lMbq3e",                     // Alternative description
+            ".fontBodyMedium .PYvSYb",     // Specific description format
+            "[data-attrid='description']", // Description attribute
+            ".Io6YTe",                     // Review snippets that might contain Instagram info
+            ".MyEned",                     // Additional content areas
+            ".fontBodyMedium span"         // General text spans
+        ];
+        // One combined query visits each element once, even where selectors overlap,
+        // so innerText (which forces layout) is computed once per element
+        for (const el of document.querySelectorAll(selectors.join(", "))) {
+            const t = visible(el) ? el.innerText.trim() : "";
+            if (t.length > 10) parts.add(t);
+        }
+        // Elements whose own text mentions an @handle, Instagram, Squarespace or Booksy,
+        // found in one text-node walk
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const raw = node.nodeValue;
+            const el = node.parentElement;
+            if (!el || !visible(el)) continue;
+            if (raw.includes("@")) {
+                const t = el.innerText.trim();
+                if (t.includes("@")) parts.add(t);
+            }
+            if (/instagram|Instagram|IG|ig/.test(raw) || /squarespace|booksy/i.test(raw)) {
+                const t = el.innerText.trim();
+                if (t && t.length < 200) parts.add(t);
+            }
+        }
+        return Array.from(parts);
+    };
+    return {
+        name: text("h1.DUwDvf"),
+        phone: telHref() || panelText("button[data-item-id^='phone'] div.rogA2c") || phoneInText(),
+        address: text("button[data-item-id='address'] div.rogA2c"),
+        website: href("a[data-item-id='authority']") || href("a[aria-label^='Website:']"),
+        description: descriptionParts(),
+        // A fully loaded page without a name is a dead listing, not a slow one
+        loaded: document.readyState === "complete",
+        // Google's rate-limit interstitial ("unusual traffic" captcha)
+        blocked: location.pathname.startsWith("/sorry/") || !!document.querySelector("form[action*='sorry/index']")
+    };
+})()
+"""
+
+
+# Patterns used for every extracted business, compiled once at import time.
+# Place ID in either the data parameter's "!1s0x...:0x<hex>" form or the classic "cid=<decimal>"
+_CID_RE = re.compile(r'!1s0x[a-f0-9]+:0x([a-f0-9]+)|cid=(\d+)', re.IGNORECASE)
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF]+')
+_ADDRESS_SEP_RE = re.compile(r'\s*([,GJWX])\s*')
+_HTTP_URL_RE = re.compile(r'^https?://')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PHONE_RE = re.compile(r'\(\d{3}\)\s?\d{3}-?\d{4}')
+
+# Server-rendered place page markers read by the HTTP fast path
+_HTTP_TITLE_RE = re.compile(r'<meta content="([^"]*)" property="og:title"')
+_APP_STATE_RE = re.compile(r'window\.APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS', re.DOTALL)
+_REDIRECT_URL_RE = re.compile(r'/url\?q=(https?://[^&"\\]+)')
+_PLACE_URL_RE = re.compile(r'(?:https://www\.google\.com)?/maps/place/[^"\'\\\s<>]+')
+
+# Squarespace-hosted sites, matched on the URL's host (subdomains included)
+_SQUARESPACE_DOMAINS = frozenset(
+    f'squarespace.{tld}' for tld in ('com', 'net', 'org', 'io', 'co', 'me', 'app')
+)
+
+# Hosts that are never a business's own website (subdomains included).
+_EXCLUDED = frozenset({
+    'google.com', 'maps.google.com', 'facebook.com', 'instagram.com',
+    'twitter.com', 'youtube.com', 'tiktok.com', 'linkedin.com'
+})
+
+# Google-owned hosts that never count as a business website
+_GOOGLE_DOMAINS = frozenset({
+    'google.com', 'googleusercontent.com', 'gstatic.com', 'googleapis.com'
+})
+
+
+# Hosted platforms a business may list instead of its own site, mapped to their website_type
+_PLATFORM_TYPES = {
+    'instagram.com': 'instagram',
+    'facebook.com': 'facebook',
+    'booksy.com': 'booksy',
+    'squarespace.com': 'squarespace',
+}
+
+
+def _host_platform(host: str) -> Optional[str]:
+    """Return the website_type of the platform serving host (or any parent domain), if any."""
+    while host:
+        platform = _PLATFORM_TYPES.get(host)
+        if platform:
+            return platform
+        host = host.partition('.')[2]
+    return None
+
+
+# Query parameters Maps adds for UI state and attribution; they don't change which place a URL shows
+_VOLATILE_PARAMS = frozenset({'hl', 'gl', 'entry', 'g_ep', 'authuser', 'ucbcb', 'coh'})
+
+
+def _normalize_place_url(url: str) -> str:
+    """Drop volatile query parameters so variants of the same place URL compare equal."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _VOLATILE_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _host_in(host: str, domains: frozenset) -> bool:
+    """Whether host is one of domains or a subdomain of one; one set lookup per domain label."""
+    while host:
+        if host in domains:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _url_host(url: str) -> str:
+    """
+    Lowercased host of a URL (scheme optional), without credentials or port.
+    Memoized: a business website is validated and then classified, and chains repeat across businesses.
+    """
+    try:
+        # hostname drops the query, fragment, credentials and port, and lowercases
+        return urlsplit(url if '//' in url else '//' + url).hostname or ''
+    except ValueError:
+        return ''
+
+
+# Regional Google hosts such as google.com.au or google.co.uk (subdomains included)
+_GOOGLE_REGIONAL_RE = re.compile(r'(?:^|\.)google\.(?:com?\.)?[a-z]{2,3}$')
+
+
+def _is_google_host(host: str) -> bool:
+    """Whether host belongs to Google, on its .com domains or a regional one."""
+    return _host_in(host, _GOOGLE_DOMAINS) or bool(_GOOGLE_REGIONAL_RE.search(host))
+
+
+# Headings Maps shows in place of a business name when the page or a selector is wrong
+_SUSPECT_NAMES = frozenset({"google maps", "results", "sponsored", "search results"})
+
+
+def _plausible_name(name: str) -> bool:
+    """Cheap sanity check on an extracted business name; failures are re-read by the validation pass."""
+    name = name.strip() if name else ""
+    return 0 < len(name) <= 200 and name.lower() not in _SUSPECT_NAMES and not _HTTP_URL_RE.match(name)
+
+
+# Upper bound on parallel browsers; more than this invites Google Maps throttling
+MAX_WORKERS = 8
+
+# Extraction failures kept for the end-of-run report
+MAX_FAILURE_LOG = 200
+
+# Businesses iter_businesses buffers ahead of a slow consumer before the scrape waits
+STREAM_QUEUE_SIZE = 32
+
+
+# Upper bound for any in-page script, so a wedged page can't stall a worker indefinitely
+SCRIPT_TIMEOUT_MS = 5000
+
+# Business links inside the search results feed.
+LISTING_SELECTOR = "[role='feed'] a[href*='/maps/place/']"
+
+# Locators passed to explicit waits, built once instead of on every call
+FEED_LOCATOR = (By.CSS_SELECTOR, "div[role='feed']")
+PLACE_LINK_LOCATOR = (By.CSS_SELECTOR, "a[href*='/maps/place/']")
+BUSINESS_HEADER_LOCATOR = (By.CSS_SELECTOR, "h1.DUwDvf")
+
+# Counts nodes added to the results feed so scroll waits poll one number instead of re-measuring the DOM
+WATCH_FEED_JS = """
+if (window.__feedObserver) window.__feedObserver.disconnect();
+window.__feedAdds = 0;
+window.__feedObserver = new MutationObserver(ms => {
+    for (const m of ms) window.__feedAdds += m.addedNodes.length;
+    if (window.__onFeedAdd) window.__onFeedAdd();
+});
+window.__feedObserver.observe(arguments[0], {childList: true, subtree: true});
+"""
+
+# Scrolls the feed and resolves as soon as the observer above reports new nodes, or with
+# false after the timeout: one async round-trip per scroll instead of a polling loop
+SCROLL_FEED_JS = """
+const [feed, last, timeoutMs, done] = arguments;
+feed.scrollTop = feed.scrollHeight;
+const finish = value => { window.__onFeedAdd = null; clearTimeout(timer); done(value); };
+const timer = setTimeout(() => finish(false), timeoutMs);
+window.__onFeedAdd = () => { if (window.__feedAdds > last) finish(window.__feedAdds); };
+window.__onFeedAdd();
+"""
+
+# Every listing href in the feed, serialized in one evaluation
+LISTING_HREFS_JS = f"Array.from(document.querySelectorAll({LISTING_SELECTOR!r}), a => a.href)"
+
+
+# One keep-alive HTTP session for the fast path, shared by every scraper so parallel workers
+# reuse the same warm TLS connections to google.com
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def _get_http_session() -> "requests.Session":
+    """Create the shared HTTP session on first use, with a connection pool sized for MAX_WORKERS."""
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            # Imported here: only the http_first fast path needs requests
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en"})
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS * 2)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _HTTP_SESSION = session
+        return _HTTP_SESSION
+
+
+# Per-user directory for everything the scraper keeps between runs
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".gmaps_scraper")
+
+
+# chromedriver path resolved once per process and shared by every browser; it is also
+# remembered on disk for a day so new runs skip webdriver-manager's online version check
+_DRIVER_PATH = None
+_DRIVER_PATH_LOCK = threading.Lock()
+DRIVER_PATH_FILE = os.path.join(APP_DATA_DIR, "chromedriver_path")
+DRIVER_PATH_MAX_AGE = 24 * 3600
+
+
+def _read_saved_driver_path() -> Optional[str]:
+    """Return the chromedriver path saved by an earlier run if it is recent and still exists."""
+    try:
+        if time.time() - os.path.getmtime(DRIVER_PATH_FILE) > DRIVER_PATH_MAX_AGE:
+            return None
+        with open(DRIVER_PATH_FILE, encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def _get_driver_path() -> str:
+    """Resolve the chromedriver binary once; later calls reuse the cached path."""
+    global _DRIVER_PATH
+    with _DRIVER_PATH_LOCK:
+        if _DRIVER_PATH is None:
+            _DRIVER_PATH = _read_saved_driver_path()
+        if _DRIVER_PATH is None:
+            # Imported here: webdriver_manager is slow to import and only needed when no path is cached
+            from webdriver_manager.chrome import ChromeDriverManager
+            _DRIVER_PATH = ChromeDriverManager().install()
+            try:
+                os.makedirs(os.path.dirname(DRIVER_PATH_FILE), exist_ok=True)
+                with open(DRIVER_PATH_FILE, "w", encoding="utf-8") as f:
+                    f.write(_DRIVER_PATH)
+            except OSError:
+                pass
+        return _DRIVER_PATH
+
+
+def _forget_driver_path():
+    """Drop the cached chromedriver path, e.g. after Chrome updated and the driver no longer matches."""
+    global _DRIVER_PATH
+    with _DRIVER_PATH_LOCK:
+        _DRIVER_PATH = None
+        try:
+            os.remove(DRIVER_PATH_FILE)
+        except OSError:
+            pass
+
+
+# Persistent Chrome profiles, one per concurrently running browser, so the HTTP disk cache
+# (Maps' multi-MB script bundles) survives between runs
+PROFILE_ROOT = APP_DATA_DIR
+_profile_slots = set()
+_PROFILE_LOCK = threading.Lock()
+
+
+def _claim_profile_slot() -> int:
+    """Reserve the lowest profile number not used by another browser in this process."""
+    with _PROFILE_LOCK:
+        slot = 0
+        while slot in _profile_slots:
+            slot += 1
+        _profile_slots.add(slot)
+        return slot
+
+
+def _release_profile_slot(slot: int):
+    """Make a profile number available to the next browser."""
+    with _PROFILE_LOCK:
+        _profile_slots.discard(slot)
+
+
+# Businesses extracted in earlier runs, reused for a day so repeat searches skip the browser.
+# Bump CACHE_VERSION whenever the shape of the stored business data changes.
+BUSINESS_CACHE_FILE = os.path.join(APP_DATA_DIR, "business_cache.sqlite3")
+BUSINESS_CACHE_TTL = 24 * 3600
+CACHE_VERSION = 1
+# Pages that loaded without a business on them are skipped for an hour before being retried
+FAILED_URL_TTL = 3600
+# Oldest businesses are evicted beyond this many entries, so the cache file stays small
+BUSINESS_CACHE_MAX_ENTRIES = 20000
+
+
+class BusinessCache:
+    """
+    SQLite-backed store of extracted business data keyed by business identifier (CID).
+    Entries older than ttl seconds are treated as missing. Businesses whose page had no
+    usable data are remembered separately for failed_ttl seconds. Expired entries are pruned
+    when the cache opens, keeping at most max_entries businesses. Safe to share between threads.
+    """
+    
+    def __init__(self, path: str = BUSINESS_CACHE_FILE, ttl: float = BUSINESS_CACHE_TTL,
+                 failed_ttl: float = FAILED_URL_TTL, max_entries: int = BUSINESS_CACHE_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl
+        self.failed_ttl = failed_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS businesses "
+                "(key TEXT PRIMARY KEY, data TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS failures (key TEXT PRIMARY KEY, stored_at REAL NOT NULL)"
+            )
+            # Entries written under another CACHE_VERSION can never be read again
+            self._db.execute("DELETE FROM businesses WHERE key NOT LIKE ?", (self._versioned("%"),))
+            self._db.execute("DELETE FROM failures WHERE key NOT LIKE ?", (self._versioned("%"),))
+        self.prune()
+    
+    def prune(self):
+        """Delete expired entries, then the oldest businesses beyond max_entries."""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM businesses WHERE stored_at <= ?", (now - self.ttl,))
+            self._db.execute("DELETE FROM failures WHERE stored_at <= ?", (now - self.failed_ttl,))
+            self._db.execute(
+                "DELETE FROM businesses WHERE key NOT IN "
+                "(SELECT key FROM businesses ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+    
+    @staticmethod
+    def _versioned(key: str) -> str:
+        """Prefix a key with CACHE_VERSION so a format change starts from an empty cache."""
+        return f"v{CACHE_VERSION}:{key}"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached business for key, or None if it is missing or expired."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM businesses WHERE key = ? AND stored_at > ?",
+                (self._versioned(key), time.time() - self.ttl)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set(self, key: str, business_data: Dict):
+        """Store business data under key, replacing any older entry."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO businesses (key, data, stored_at) VALUES (?, ?, ?)",
+                (self._versioned(key), json.dumps(business_data), time.time())
+            )
+            self._db.execute("DELETE FROM failures WHERE key = ?", (self._versioned(key),))
+    
+    def mark_failed(self, key: str):
+        """Remember that key's page held no extractable business."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO failures (key, stored_at) VALUES (?, ?)",
+                (self._versioned(key), time.time())
+            )
+    
+    def failed_recently(self, key: str) -> bool:
+        """Whether key was marked failed within the last failed_ttl seconds."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM failures WHERE key = ? AND stored_at > ?",
+                (self._versioned(key), time.time() - self.failed_ttl)
+            ).fetchone()
+        return row is not None
+    
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one entry, or every entry when no key is given, failures included."""
+        with self._lock, self._db:
+            for table in ("businesses", "failures"):
+                if key is None:
+                    self._db.execute(f"DELETE FROM {table}")
+                else:
+                    self._db.execute(f"DELETE FROM {table} WHERE key = ?", (self._versioned(key),))
+
+
+_BUSINESS_CACHE = None
+_BUSINESS_CACHE_LOCK = threading.Lock()
+
+
+def _get_business_cache() -> Optional[BusinessCache]:
+    """Open the shared business cache on first use; None if the cache file can't be opened."""
+    global _BUSINESS_CACHE
+    with _BUSINESS_CACHE_LOCK:
+        if _BUSINESS_CACHE is None:
+            try:
+                _BUSINESS_CACHE = BusinessCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("⚠️ Business cache unavailable, scraping without it: %s", e)
+                return None
+        return _BUSINESS_CACHE
+
+
+@lru_cache(maxsize=32)
+def _build_chrome_options(headless: bool, profile_dir: Optional[str] = None) -> Options:
+    """
+    Build the Chrome options for a browser; they only depend on headless mode and profile.
+    Cached, so callers must not modify the returned object.
+    """
+    chrome_options = Options()
+    
+    # Essential flags for stability
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    # Trim per-browser memory and background work: every pooled worker runs its own Chrome
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-breakpad")
+    chrome_options.add_argument("--disable-component-update")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-features=Translate,OptimizationHints,MediaRouter")
+    
+    # Force English locale
+    chrome_options.add_argument("--lang=en-US")
+    chrome_options.add_argument("--accept-lang=en-US,en")
+    
+    # Set viewport and zoom for consistency
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+    else:
+        chrome_options.add_argument("--start-maximized")
+    
+    chrome_options.add_argument("--force-device-scale-factor=1")
+    
+    # Minimal logging
+    chrome_options.add_argument("--log-level=3")
+    
+    # Return from driver.get at DOMContentLoaded; every extraction is gated on explicit waits
+    chrome_options.page_load_strategy = 'eager'
+    
+    # Anti-detection
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Set English as preferred language (2024 fix), skip image downloads/decoding and
+    # deny notification permission prompts outright
+    chrome_options.add_experimental_option('prefs', {
+        'intl.accept_languages': 'en-US,en',
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    
+    # Standard user agent
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    
+    # Reuse a persistent profile and give it a 256 MB HTTP disk cache
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--disk-cache-size=268435456")
+    
+    # Deliberately left alone for Maps compatibility: GPU/rendering, memory pressure and
+    # timer throttling settings. Only idle background services are turned off (above).
+    
+    return chrome_options
+
+
+def _quit_quietly(driver):
+    """Quit a WebDriver session, ignoring errors from an already dead browser."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class _RemoteChrome(webdriver.Remote):
+    """Chrome on a Selenium Grid node, with the same execute_cdp_cmd as a local webdriver.Chrome."""
+    
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class _SoftBlocked(WebDriverException):
+    """Google served a captcha page instead of the listing; the browser session is burned."""
+
+
+class RateLimiter:
+    """
+    Token bucket allowing rate page loads per second on average, in bursts of up to burst.
+    Shared by all of a scraper's browsers; acquire() only sleeps when loads arrive faster than that.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, waiting for it if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            # Going into debt reserves the next token, so concurrent callers queue up fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD cap on simultaneous page loads across a browser pool: one more slot after each clean
+    load, half as many after an error or captcha page. Parallel extraction settles just under
+    the rate at which Google starts pushing back, instead of every browser hammering it at once.
+    """
+    
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.limit = maximum
+        self._active = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        """Wait until fewer than limit loads are running, then take a slot."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+    
+    def release(self, congested: bool):
+        """Give the slot back, growing the limit by one or halving it if Google pushed back."""
+        with self._cond:
+            self._active -= 1
+            if congested:
+                self.limit = max(1, self.limit // 2)
+                logger.info("🐢 Google is pushing back; extracting with at most %s browser(s)", self.limit)
+            else:
+                self.limit = min(self.limit + 1, self.maximum)
+            self._cond.notify_all()
+
+
+class DriverPool:
+    """
+    Thread-safe pool of browser-owning scrapers.
+    Browsers stay open between scrape runs and are only replaced when their session is lost.
+    A checked-out scraper is driven by exactly one thread, so each driver's single-connection
+    HTTP pool to chromedriver is never contended; parallelism comes from more browsers.
+    """
+    
+    def __init__(self):
+        # One condition guards all checkout state, so acquire() can wait for a specific
+        # scraper without taking anyone else's off the idle list
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._checked_out = set()
+        self._owned = []
+        self._discarded = set()
+        self.size = 0
+    
+    def add(self, scraper: 'GoogleMapsScraper', owned: bool = True, idle: bool = True):
+        """
+        Add a scraper to the pool; owned scrapers are closed with the pool. With idle=False
+        it joins already checked out, and other threads only get it once it is released.
+        """
+        with self._cond:
+            if owned:
+                self._owned.append(scraper)
+            self.size += 1
+            if idle:
+                self._idle.append(scraper)
+                self._cond.notify_all()
+            else:
+                self._checked_out.add(scraper)
+    
+    def get(self) -> 'GoogleMapsScraper':
+        """Check out an idle scraper, blocking until one is available."""
+        with self._cond:
+            while not self._idle:
+                self._cond.wait()
+            scraper = self._idle.popleft()
+            self._checked_out.add(scraper)
+            return scraper
+    
+    def acquire(self, scraper: 'GoogleMapsScraper') -> 'GoogleMapsScraper':
+        """Check out one specific scraper, blocking until whoever holds it releases it."""
+        with self._cond:
+            while scraper not in self._idle:
+                self._cond.wait()
+            self._idle.remove(scraper)
+            self._checked_out.add(scraper)
+            return scraper
+    
+    def discard(self, scraper: 'GoogleMapsScraper', checked_out_by_caller: bool = False):
+        """
+        Remove a scraper from the pool without closing it; a checked-out one is dropped on release,
+        unless the caller holds it and won't release it.
+        """
+        with self._cond:
+            if scraper in self._idle:
+                self._idle.remove(scraper)
+            elif checked_out_by_caller:
+                self._checked_out.discard(scraper)
+            elif scraper in self._checked_out:
+                self._discarded.add(scraper)
+            if scraper in self._owned:
+                self._owned.remove(scraper)
+            self.size -= 1
+    
+    def release(self, scraper: 'GoogleMapsScraper'):
+        """Return a scraper to the pool without closing its browser."""
+        with self._cond:
+            self._checked_out.discard(scraper)
+            if scraper in self._discarded:
+                self._discarded.discard(scraper)
+                return
+            self._idle.append(scraper)
+            self._cond.notify_all()
+    
+    def close(self):
+        """Close every browser owned by the pool."""
+        with self._cond:
+            owned, self._owned = self._owned, []
+            self._idle.clear()
+            self._checked_out.clear()
+            self.size = 0
+        for scraper in owned:
+            scraper.close()
 
 
 class GoogleMapsScraper:
@@ -18,16 +746,71 @@ class GoogleMapsScraper:
     Designed for maximum speed, accuracy, and reliability in lead generation.
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, stop_event=None, workers: int = 1, tabs: int = 1,
+                 http_first: bool = False, pool: Optional[DriverPool] = None,
+                 persistent_profile: bool = True, delay_between_requests: float = 0.0,
+                 use_cache: bool = True, force_rescrape: bool = False, grid_url: Optional[str] = None):
         """
         Initialize the scraper with Chrome WebDriver and performance optimizations.
         
         Args:
             headless (bool): Whether to run browser in headless mode
+            stop_event: Optional threading.Event; when set, scraping stops at the next checkpoint
+            workers (int): Number of Chrome instances used to extract business pages in parallel (max MAX_WORKERS)
+            tabs (int): Number of tabs used to overlap page loads when extracting with one browser
+            http_first (bool): Try plain HTTP fetches of the search page and of each business page
+                before falling back to the browser
+            pool (DriverPool, optional): Shared pool of warm browsers to extract with; it is left
+                open when this scraper closes. By default the scraper creates and owns its own pool.
+            persistent_profile (bool): Keep Chrome's profile and disk cache under PROFILE_ROOT
+                between runs instead of starting from an empty temporary profile
+            delay_between_requests (float): Minimum average seconds between business page loads,
+                across all of this scraper's browsers. Loads slower than that are never delayed.
+                Zero by default; the scraper backs off on its own when Google serves a captcha page.
+            use_cache (bool): Reuse businesses extracted within the last BUSINESS_CACHE_TTL seconds,
+                including by earlier runs, instead of loading their pages again
+            force_rescrape (bool): Load every business page even if it is cached; fresh results
+                still refresh the cache
+            grid_url (str, optional): Selenium Grid hub (e.g. http://selenium-hub:4444/wd/hub) to
+                start Chrome on instead of locally; pooled workers start there too. Persistent
+                profiles don't apply, as they live on the local disk.
         """
         self.driver = None
         self.wait = None
         self.headless = headless
+        self.stop_event = stop_event
+        self.workers = max(1, min(workers, MAX_WORKERS))
+        self.tabs = max(1, tabs)
+        self.http_first = http_first
+        self.grid_url = grid_url
+        self.persistent_profile = persistent_profile and not grid_url
+        self._profile_slot = None
+        
+        # Request pacing: an optional rate limit plus exponential backoff after captcha pages
+        self.delay_between_requests = max(0.0, delay_between_requests)
+        self._limiter = RateLimiter(1.0 / self.delay_between_requests) if self.delay_between_requests > 0 else None
+        self._block_backoff = 0
+        
+        # Businesses extracted by earlier runs, shared by every scraper in the process
+        self.use_cache = use_cache
+        self.force_rescrape = force_rescrape
+        self._cache = _get_business_cache() if use_cache else None
+        
+        # Called with each newly found listing URL while results are still being scrolled
+        self._on_listing = None
+        # Called with each business as soon as it is extracted or read from the cache
+        self._on_business = None
+        # Set when an iter_businesses consumer stops early, so the background scrape ends too
+        self._stream_abandoned = threading.Event()
+        # Businesses finished by the current scrape run, kept so a failed run can resume
+        self._completed = []
+        
+        # Pool of browsers used for parallel extraction; kept alive across scrape runs. The
+        # concurrency cap is reset to the pool size at the start of each parallel extraction
+        self._concurrency = None
+        self._pool = pool
+        self._owns_pool = pool is None
+        self._in_pool = False
         
         # Enhanced error and duplicate tracking
         self.consecutive_failures = 0
@@ -36,106 +819,137 @@ class GoogleMapsScraper:
         self.max_session_restarts = 3
         
         self.visited_cids = set()
-        self.extraction_failures = []
+        # Only the most recent failures are kept: each carries an HTML snippet, and a scraper
+        # reused across many searches would otherwise hold every one of them
+        self.extraction_failures = deque(maxlen=MAX_FAILURE_LOG)
+        
+        # Cached browser health: only probe the driver every health_check_interval seconds
+        self.health_check_interval = 5.0
+        self._session_ok = False
+        self._last_health_check = 0.0
         
         self.setup_driver()
     
     def setup_driver(self):
         """Sets up Chrome WebDriver with minimal, stable configuration for Google Maps compatibility."""
+        profile_dir = None
         try:
-            chrome_options = Options()
-            
-            # Essential flags for stability
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            # Force English locale
-            chrome_options.add_argument("--lang=en-US")
-            chrome_options.add_argument("--accept-lang=en-US,en")
-            
-            # Set viewport and zoom for consistency
-            if self.headless:
-                chrome_options.add_argument("--headless=new")
-                chrome_options.add_argument("--window-size=1920,1080")
-            else:
-                chrome_options.add_argument("--start-maximized")
-            
-            chrome_options.add_argument("--force-device-scale-factor=1")
-            
-            # Minimal logging
-            chrome_options.add_argument("--log-level=3")
-            
-            # Anti-detection
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Set English as preferred language (2024 fix)
-            chrome_options.add_experimental_option('prefs', {
-                'intl.accept_languages': 'en-US,en'
-            })
-            
-            # Standard user agent
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            if self.persistent_profile:
+                if self._profile_slot is None:
+                    self._profile_slot = _claim_profile_slot()
+                profile_dir = os.path.join(PROFILE_ROOT, f"profile-{self._profile_slot}")
+            chrome_options = _build_chrome_options(self.headless, profile_dir)
             
-            # REMOVED ALL AGGRESSIVE OPTIMIZATIONS:
-            # - No GPU/rendering disabling
-            # - No background process disabling  
-            # - No memory pressure modifications
-            # - No network optimizations
-            # - No timer throttling changes
-            # - No plugin/extension disabling
-            
-            # Setup Chrome service
-            print("🔧 Setting up Chrome driver...")
-            service = ChromeService(ChromeDriverManager().install())
-            service.log_path = None
+            service = None
+            if not self.grid_url:
+                # Setup Chrome service
+                logger.info("🔧 Setting up Chrome driver...")
+                service = ChromeService(_get_driver_path())
             
             # Initialize driver with timeout
-            print("🚀 Starting Chrome browser...")
-            import signal
+            logger.info("🚀 Starting Chrome browser...")
             
             def timeout_handler(signum, frame):
                 raise TimeoutError("Chrome startup timed out")
             
-            # Set timeout for Chrome startup (60 seconds)
-            if hasattr(signal, 'SIGALRM'):  # Unix systems
+            # Set timeout for Chrome startup (60 seconds); signals only work on the main thread
+            use_alarm = hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread()
+            if use_alarm:  # Unix systems
                 signal.signal(signal.SIGALRM, timeout_handler)
                 signal.alarm(60)
             
             try:
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                if self.grid_url:
+                    # The goog/cdp endpoint of the Chromium connection keeps every CDP call working
+                    connection = ChromiumRemoteConnection(self.grid_url, "goog", "chrome")
+                    self.driver = _RemoteChrome(command_executor=connection, options=chrome_options)
+                else:
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 
                 # Enforce consistent zoom level
                 self.driver.set_window_size(1920, 1080)
                 self.driver.execute_script("document.body.style.zoom='100%'")
 
-                if hasattr(signal, 'SIGALRM'):
+                if use_alarm:
                     signal.alarm(0)
                 
-                print("✅ Chrome browser started successfully")
+                logger.info("✅ Chrome browser started successfully")
                 
                 # Optimized timeout settings for speed (updated 2024)
-                self.driver.set_page_load_timeout(30)  # Reduced for faster processing
-                self.driver.implicitly_wait(3)  # Reduced for faster element detection
-                self.wait = WebDriverWait(self.driver, 10)  # Reduced for faster explicit waits
+                self.driver.set_page_load_timeout(15)  # Eager loads return at DOMContentLoaded
+                self.driver.set_script_timeout(5)  # Bounds async scripts; evaluations carry their own timeout
+                # No implicit wait: it would stall every WebDriverWait poll on a missing element
+                self.driver.implicitly_wait(0)
+                # Explicit waits are the readiness gate under the eager load strategy; poll every
+                # 100ms rather than the default 500ms so a ready page is picked up promptly
+                self.wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
                 
-                # Minimal JavaScript injection
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                self._prepare_tab()
                 
-                print("✅ Chrome WebDriver configured for maximum stability")
+                self._session_ok = True
+                self._last_health_check = time.monotonic()
+                
+                logger.info("✅ Chrome WebDriver configured for maximum stability")
                 
             except TimeoutError:
-                print("❌ Chrome startup timed out after 60 seconds")
+                logger.error("❌ Chrome startup timed out after 60 seconds")
                 raise Exception("Browser startup timed out - please try again")
             except Exception as e:
-                if hasattr(signal, 'SIGALRM'):
+                if use_alarm:
                     signal.alarm(0)
                 raise e
             
         except Exception as e:
-            print(f"❌ Failed to initialize Chrome WebDriver: {e}")
+            if profile_dir:
+                # Most likely the profile is locked by another running copy of the app
+                logger.warning("⚠️ Could not start Chrome with profile %s, using a temporary profile: %s", profile_dir, e)
+                self._release_profile()
+                self.persistent_profile = False
+                return self.setup_driver()
+            logger.error("❌ Failed to initialize Chrome WebDriver: %s", e)
+            # Re-resolve chromedriver next time in case the cached one no longer matches Chrome
+            _forget_driver_path()
             raise
     
+    def _release_profile(self):
+        """Give this browser's persistent profile slot back."""
+        if self._profile_slot is not None:
+            _release_profile_slot(self._profile_slot)
+            self._profile_slot = None
+    
+    def _prepare_tab(self):
+        """
+        Apply per-tab CDP settings to the current tab. CDP commands only reach the tab
+        they were sent to, so every newly opened tab needs this too.
+        """
+        # Hide navigator.webdriver in every document before page scripts run
+        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        })
+        
+        # Drop images, fonts, media and trackers before they hit the wire
+        self._block_unneeded_resources()
+    
+    def _block_unneeded_resources(self):
+        """Block resource types the scraper never reads via the Chrome DevTools Protocol."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning("⚠️ Could not enable resource blocking: %s", e)
+    
+    def _note_driver_error(self, error: Exception):
+        """Invalidate the cached health flag when an error shows the session is gone."""
+        message = str(error).lower()
+        if "invalid session id" in message or "disconnected" in message:
+            self._session_ok = False
+    
+    def _stop_requested(self) -> bool:
+        """Check whether the caller asked the current scrape to stop."""
+        if self._stream_abandoned.is_set():
+            return True
+        return self.stop_event is not None and self.stop_event.is_set()
+    
     def search_google_maps(self, keyword: str, city: str) -> bool:
         """
         Optimized Google Maps search with enhanced error recovery.
@@ -154,16 +968,16 @@ class GoogleMapsScraper:
             try:
                 # Check browser connectivity before search
                 if not self._is_browser_connected():
-                    print(f"❌ Browser not connected on search attempt {attempt + 1}")
+                    logger.error("❌ Browser not connected on search attempt %s", attempt + 1)
                     if attempt < max_retries - 1:
-                        print("🔄 Attempting to recover browser session...")
+                        logger.info("🔄 Attempting to recover browser session...")
                         self._recover_browser_session()
                         continue
                     return False
                 
                 # Construct search query
                 query = f"{keyword} in {city}"
-                print(f"🔍 Searching for: {query} (attempt {attempt + 1}/{max_retries})")
+                logger.info("🔍 Searching for: %s (attempt %s/%s)", query, attempt + 1, max_retries)
                 
                 # Navigate to Google Maps with optimized URL and English locale
                 encoded_query = query.replace(" ", "+")
@@ -175,47 +989,48 @@ class GoogleMapsScraper:
                 # Enhanced wait for search results with multiple fallback conditions
                 try:
                     # Primary wait condition
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[role='feed']")))
-                    print("✅ Search results loaded successfully")
+                    self.wait.until(EC.presence_of_element_located(FEED_LOCATOR))
+                    logger.info("✅ Search results loaded successfully")
                     self.consecutive_failures = 0  # Reset failure counter
                     return True
                 except TimeoutException:
                     # Fallback: check for any business listings
                     try:
                         WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/maps/place/']"))
+                            EC.presence_of_element_located(PLACE_LINK_LOCATOR)
                         )
-                        print("✅ Search results loaded (fallback detection)")
+                        logger.info("✅ Search results loaded (fallback detection)")
                         self.consecutive_failures = 0  # Reset failure counter
                         return True
                     except TimeoutException:
-                        print(f"⚠️ Search results timeout on attempt {attempt + 1}")
+                        logger.warning("⚠️ Search results timeout on attempt %s", attempt + 1)
                         if attempt < max_retries - 1:
-                            print(f"🔄 Retrying in {retry_delay} seconds...")
+                            logger.info("🔄 Retrying in %s seconds...", retry_delay)
                             time.sleep(retry_delay)
                             continue
                         else:
-                            print("❌ All search attempts failed - no businesses found")
+                            logger.error("❌ All search attempts failed - no businesses found")
                             return False
                     
             except WebDriverException as e:
-                print(f"❌ WebDriver error on search attempt {attempt + 1}: {e}")
+                logger.error("❌ WebDriver error on search attempt %s: %s", attempt + 1, e)
+                self._note_driver_error(e)
                 if "invalid session id" in str(e).lower():
-                    print("🔄 Session lost, attempting recovery...")
+                    logger.info("🔄 Session lost, attempting recovery...")
                     if attempt < max_retries - 1:
                         self._recover_browser_session()
                         continue
                     return False
                 elif attempt < max_retries - 1:
-                    print(f"🔄 Retrying in {retry_delay} seconds...")
+                    logger.info("🔄 Retrying in %s seconds...", retry_delay)
                     time.sleep(retry_delay)
                     continue
                 else:
                     return False
             except Exception as e:
-                print(f"❌ Search failed on attempt {attempt + 1}: {e}")
+                logger.error("❌ Search failed on attempt %s: %s", attempt + 1, e)
                 if attempt < max_retries - 1:
-                    print(f"🔄 Retrying in {retry_delay} seconds...")
+                    logger.info("🔄 Retrying in %s seconds...", retry_delay)
                     time.sleep(retry_delay)
                     continue
                 else:
@@ -223,104 +1038,134 @@ class GoogleMapsScraper:
         
         return False
     
-    def _scroll_results(self):
-        """Scrolls the search results panel to load more businesses."""
+    def _scroll_results(self, max_listings: Optional[int] = None, seen: Optional[set] = None,
+                        business_urls: Optional[List[str]] = None):
+        """
+        Scrolls the search results panel to load more businesses.
+        When max_listings is given, listings are collected after each scroll and
+        scrolling stops as soon as enough unique URLs have been found.
+        """
         try:
             scrollable_element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='feed']"))
+                EC.presence_of_element_located(FEED_LOCATOR)
             )
             
-            print("📜 Scrolling to load more results...")
-            last_height = self.driver.execute_script("return arguments[0].scrollHeight", scrollable_element)
+            logger.debug("📜 Scrolling to load more results...")
+            self.driver.execute_script(WATCH_FEED_JS, scrollable_element)
+            last_adds = 0
             
+            stale_rounds = 0
             for _ in range(10): # Scroll up to 10 times
-                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", scrollable_element)
-                time.sleep(2) # Wait for new results to load
-                
-                new_height = self.driver.execute_script("return arguments[0].scrollHeight", scrollable_element)
-                if new_height == last_height:
-                    print("✅ Reached the end of the results.")
+                if self._stop_requested():
                     break
-                last_height = new_height
+                
+                # Scroll, then let the page report when new results grow the feed
+                try:
+                    adds = self.driver.execute_async_script(SCROLL_FEED_JS, scrollable_element, last_adds, 1500)
+                except TimeoutException:
+                    adds = False
+                if adds:
+                    last_adds = adds
+                    stale_rounds = 0
+                else:
+                    # Two stalls in a row means the feed is exhausted; one may just be a slow load
+                    stale_rounds += 1
+                    if stale_rounds >= 2:
+                        logger.info("✅ Reached the end of the results.")
+                        break
+                    time.sleep(min(0.2 * 2 ** stale_rounds, 1.0))
+                    continue
+                
+                if max_listings is not None:
+                    try:
+                        self._collect_listings(seen, business_urls)
+                    except WebDriverException as e:
+                        logger.warning("⚠️ Error collecting listings while scrolling: %s", e)
+                        break
+                    if len(seen) >= max_listings:
+                        logger.info("✅ Collected %s listings, enough for this run.", len(seen))
+                        break
                 
         except TimeoutException:
-            print("⚠️ Could not find scrollable element for results.")
+            logger.warning("⚠️ Could not find scrollable element for results.")
             
-    def get_business_listings(self) -> List[str]:
+    def _collect_listings(self, seen: set, business_urls: List[str]):
+        """Append listing URLs currently in the results feed that haven't been seen yet."""
+        # One script call returns every href instead of a get_attribute round-trip per listing
+        hrefs = self._evaluate(LISTING_HREFS_JS) or []
+        for href in hrefs:
+            # LISTING_SELECTOR only matches /maps/place/ links, so no need to re-check the path
+            if href and href not in seen:
+                seen.add(href)
+                business_urls.append(href)
+                if self._on_listing:
+                    self._on_listing(href)
+    
+    def get_business_listings(self, max_listings: Optional[int] = None) -> List[str]:
         """
         Optimized extraction of business listing URLs with enhanced error recovery.
         
+        Args:
+            max_listings (int, optional): Stop scrolling once this many unique URLs are found
+            
         Returns:
             List[str]: List of unique business listing URLs
         """
+        seen = set()
         business_urls = []
         
         try:
             # Initial extraction with improved selectors
-            print("📍 Extracting business listings...")
-            
-            # Enhanced selector for business links
-            listing_selector = "[role='feed'] a[href*='/maps/place/']"
+            logger.info("📍 Extracting business listings...")
             
             # Get initial listings with retry mechanism
             for attempt in range(3):
                 try:
                     if not self._is_browser_connected():
-                        print(f"❌ Browser disconnected during listing extraction (attempt {attempt + 1})")
+                        logger.error("❌ Browser disconnected during listing extraction (attempt %s)", attempt + 1)
                         if attempt < 2:
                             self._recover_browser_session()
                             continue
                         break
                     
-                    listings = self.driver.find_elements(By.CSS_SELECTOR, listing_selector)
-                    for listing in listings:
-                        href = listing.get_attribute('href')
-                        if href and '/maps/place/' in href and href not in business_urls:
-                            business_urls.append(href)
+                    self._collect_listings(seen, business_urls)
                     
-                    print(f"📍 Found {len(business_urls)} initial business listings")
+                    logger.info("📍 Found %s initial business listings", len(business_urls))
                     break
                     
                 except Exception as e:
-                    print(f"⚠️ Error extracting initial listings (attempt {attempt + 1}): {e}")
+                    logger.warning("⚠️ Error extracting initial listings (attempt %s): %s", attempt + 1, e)
                     if attempt < 2:
                         time.sleep(1)
                         continue
                     break
             
-            # Scroll to load more results if browser is stable
-            if self._is_browser_connected() and len(business_urls) > 0:
-                print("📜 Scrolling for more businesses...")
-                self._scroll_results()
+            # Scroll to load more results if browser is stable and more are still needed
+            have_enough = max_listings is not None and len(business_urls) >= max_listings
+            if not have_enough and self._is_browser_connected() and len(business_urls) > 0:
+                logger.info("📜 Scrolling for more businesses...")
+                self._scroll_results(max_listings, seen, business_urls)
                 
                 # Extract additional listings after scrolling
                 try:
-                    listings = self.driver.find_elements(By.CSS_SELECTOR, listing_selector)
-                    for listing in listings:
-                        href = listing.get_attribute('href')
-                        if href and '/maps/place/' in href and href not in business_urls:
-                            business_urls.append(href)
+                    self._collect_listings(seen, business_urls)
                 except Exception as e:
-                    print(f"⚠️ Error extracting listings after scroll: {e}")
-            
-            # Remove any duplicates (just in case)
-            business_urls = list(dict.fromkeys(business_urls))
+                    logger.warning("⚠️ Error extracting listings after scroll: %s", e)
             
-            print(f"📍 Total unique businesses found: {len(business_urls)}")
+            logger.info("📍 Total unique businesses found: %s", len(business_urls))
             return business_urls
             
         except WebDriverException as e:
             if "invalid session id" in str(e).lower():
-                print("❌ Browser session lost during listing extraction")
-                # Return what we have so far
-                business_urls = list(dict.fromkeys(business_urls))
-                print(f"📍 Partial results: {len(business_urls)} business listings")
+                logger.error("❌ Browser session lost during listing extraction")
+                # Return what we have so far (already unique, seen guards every append)
+                logger.info("📍 Partial results: %s business listings", len(business_urls))
                 return business_urls
             else:
-                print(f"❌ WebDriver error during listing extraction: {e}")
+                logger.error("❌ WebDriver error during listing extraction: %s", e)
                 return []
         except Exception as e:
-            print(f"❌ Failed to extract business listings: {e}")
+            logger.error("❌ Failed to extract business listings: %s", e)
             return []
     
     def _clean_phone(self, phone: str) -> str:
@@ -329,7 +1174,7 @@ class GoogleMapsScraper:
             return ""
         
         # Remove non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = _PHONE_STRIP_RE.sub('', phone)
         
         # Handle US numbers
         if cleaned.startswith('+1'):
@@ -348,214 +1193,437 @@ class GoogleMapsScraper:
         if not address:
             return ""
         # Remove common Arabic prefixes/suffixes and normalize
-        address = re.sub(r'[\u0600-\u06FF]+', '', address).strip()
-        address = re.sub(r'\s*([,GJWX])\s*', r'\1', address)
+        address = _ARABIC_RE.sub('', address).strip()
+        address = _ADDRESS_SEP_RE.sub(r'\1', address)
         address = address.replace("Unnamed Road", "").strip(", ")
         return address
 
-    def _get_element_text(self, by: By, value: str) -> Optional[str]:
-        """Safely find an element by a locator and return its text."""
-        try:
-            element = self.wait.until(EC.presence_of_element_located((by, value)))
-            return element.text
-        except (NoSuchElementException, TimeoutException):
-            return None
-
-    def _get_element_attribute(self, by: By, value: str, attribute: str) -> Optional[str]:
-        """Safely find an element and return the value of a given attribute."""
-        try:
-            element = self.wait.until(EC.presence_of_element_located((by, value)))
-            return element.get_attribute(attribute)
-        except (NoSuchElementException, TimeoutException):
-            return None
-
     def _classify_website(self, url: str) -> str:
         """Classifies a URL into predefined categories."""
-        if not url or not isinstance(url, str) or url == "N/A" or not re.match(r'^https?://', url):
+        if not url or not isinstance(url, str) or url == "N/A" or not _HTTP_URL_RE.match(url):
             return "none"
         
-        url_lower = url.lower()
-        if 'instagram.com' in url_lower:
-            return 'instagram'
-        if 'facebook.com' in url_lower:
-            return 'facebook'
-        if 'booksy.com' in url_lower:
-            return 'booksy'
-        if 'squarespace.com' in url_lower:
-            return 'squarespace'
-        
-        return 'real_website'
+        # Match on the host only: one dict lookup per domain label, and a platform name in a
+        # path or query string doesn't misclassify a real website
+        return _host_platform(_url_host(url)) or 'real_website'
 
     def _run_validation_pass(self, scraped_data: List[Dict], sample_ratio: float = 0.05) -> None:
         """
-        Validates a sample of scraped data to ensure selectors are still working.
+        Validates scraped names to ensure selectors are still working. Only names that fail a
+        cheap sanity check are reloaded and re-read; at most sample_ratio of the run is revisited.
         """
         if not scraped_data:
             return
 
-        sample_size = int(len(scraped_data) * sample_ratio)
-        if sample_size == 0:
+        suspects = [business for business in scraped_data if not _plausible_name(business['name'])]
+        if not suspects:
+            logger.info("🕵️  Validation pass: all %s names look sane", len(scraped_data))
             return
-
-        print(f"🕵️  Running validation pass on {sample_size} random samples...")
-        validation_sample = random.sample(scraped_data, sample_size)
+        
+        sample = suspects[:max(1, int(len(scraped_data) * sample_ratio))]
+        logger.info("🕵️  Running validation pass on %s suspicious names...", len(sample))
         failures = 0
+        verified = 0
 
-        for business in validation_sample:
-            self.driver.get(business['url'])
-            time.sleep(2)  # Allow page to load
-            
-            # Re-extract and validate name
-            current_name = self._get_element_text(By.CSS_SELECTOR, "h1.DUwDvf")
-            if not current_name or current_name.strip() != business['name'].strip():
+        for business in sample:
+            # Re-extract with the same one-shot script the scraper uses, so the check covers its selectors
+            try:
+                self.driver.get(business['url'])
+                self.wait.until(EC.presence_of_element_located(BUSINESS_HEADER_LOCATOR))
+                current_name = (self._evaluate(EXTRACT_FIELDS_JS) or {}).get("name")
+            except (TimeoutException, WebDriverException):
+                current_name = None
+            if not current_name or not current_name.strip():
+                # The reload itself failed, which says nothing about the stored name
+                logger.debug("Validation skipped for %s: page did not load", business['url'])
+                continue
+
+            verified += 1
+            # The same odd name on a fresh load is the listing's real name; a different
+            # one means the original extraction picked up the wrong element
+            if current_name.strip() != business['name'].strip():
                 failures += 1
-                print(f"❌ Validation failed for: {business['name']} (URL: {business['url']})")
+                logger.error("❌ Validation failed for: %s (page shows %s, URL: %s)",
+                             business['name'], current_name.strip(), business['url'])
 
-        failure_rate = (failures / sample_size) * 100
-        print(f"📈 Validation failure rate: {failure_rate:.2f}%")
+        if not verified:
+            logger.warning("⚠️ Validation pass could not reload any of the sampled listings")
+            return
+
+        failure_rate = (failures / verified) * 100
+        logger.info("📈 Validation failure rate: %.2f%% (%s/%s verified)", failure_rate, failures, verified)
 
         if failure_rate > 5.0:
-            print("🚨 High validation failure rate detected! Selectors may be outdated.")
+            logger.warning("🚨 High validation failure rate detected! Selectors may be outdated.")
             
     def _is_valid_website(self, url: str) -> bool:
         """Validates if a URL is a real website and not a generic booking/social site."""
         if not url or not isinstance(url, str):
             return False
         
-        # Exclude Google and internal links
-        excluded_domains = [
-            'google.com', 'maps.google.com', 'googleusercontent.com',
-            'gstatic.com', 'googleapis.com', 'accounts.google.com'
-        ]
-        
-        for domain in excluded_domains:
-            if domain in url:
-                return False
-        
         # Must be a valid HTTP/HTTPS URL
-        return url.startswith(('http://', 'https://'))
+        if not url.startswith(('http://', 'https://')):
+            return False
+        
+        # Exclude Google and internal links (subdomains such as maps. and accounts. included)
+        return not _is_google_host(_url_host(url))
     
     def _is_browser_connected(self) -> bool:
-        """Enhanced browser connection check with multiple verification methods."""
-        try:
-            if not self.driver:
-                print("🔍 Browser check: No driver instance")
-                return False
-            
-            # Test 1: Check if driver is still alive
-            try:
-                current_url = self.driver.current_url
-                if not current_url:
-                    print("🔍 Browser check: No current URL")
-                    return False
-            except Exception as e:
-                print(f"🔍 Browser check: Failed to get current URL - {e}")
-                return False
-            
-            # Test 2: Try to execute a simple JavaScript command
-            try:
-                self.driver.execute_script("return document.readyState;")
-            except Exception as e:
-                print(f"🔍 Browser check: Failed to execute JavaScript - {e}")
-                return False
-            
-            # Test 3: Check if we can find the body element
-            try:
-                self.driver.find_element(By.TAG_NAME, "body")
-            except Exception as e:
-                print(f"🔍 Browser check: Failed to find body element - {e}")
-                return False
-            
+        """
+        Browser connection check. A healthy result is cached for health_check_interval
+        seconds; errors seen elsewhere invalidate it through _note_driver_error.
+        """
+        if not self.driver:
+            logger.warning("🔍 Browser check: No driver instance")
+            return False
+        
+        # Local check first: a dead chromedriver process needs no round-trip to detect
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        if process is not None and process.poll() is not None:
+            logger.warning("🔍 Browser check: chromedriver process has exited")
+            self._session_ok = False
+            return False
+        
+        if self._session_ok and time.monotonic() - self._last_health_check < self.health_check_interval:
             return True
-            
+        
+        # A single CDP evaluation proves both the session and the renderer are alive; unlike
+        # execute_script, chromedriver doesn't hold it back until a pending navigation settles
+        try:
+            self._evaluate("1")
         except Exception as e:
-            print(f"🔍 Browser check: Unexpected error - {e}")
+            logger.warning("🔍 Browser check: Renderer did not respond - %s", e)
+            self._session_ok = False
             return False
+        
+        self._session_ok = True
+        self._last_health_check = time.monotonic()
+        return True
     
-    def _recover_browser_session(self):
-        """Attempt to recover from browser session failures."""
+    def _recover_browser_session(self, relaunch: bool = False):
+        """
+        Attempt to recover from browser session failures. A tab reset is tried first and
+        Chrome is only relaunched if that doesn't bring the session back, or if relaunch is set.
+        """
         try:
-            print("🔄 Attempting browser session recovery...")
+            logger.info("🔄 Attempting browser session recovery...")
+            
+            if not relaunch and self._reset_tab():
+                logger.info("✅ Browser session recovered (tab reset)")
+                return True
             
             if self.session_restarts >= self.max_session_restarts:
-                print(f"❌ Maximum session restarts ({self.max_session_restarts}) reached")
+                logger.error("❌ Maximum session restarts (%s) reached", self.max_session_restarts)
                 return False
             
-            # Close existing driver
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
-            
-            # Wait before restart
-            time.sleep(2)
+            # Close existing driver. quit() already waits for Chrome to exit, so no extra settle
+            # delay is needed; without a profile directory to unlock, the new browser can even
+            # start while the old one is still shutting down
+            self._session_ok = False
+            old_driver, self.driver = self.driver, None
+            if old_driver:
+                if self._profile_slot is None:
+                    threading.Thread(target=_quit_quietly, args=(old_driver,), daemon=True).start()
+                else:
+                    _quit_quietly(old_driver)
             
             # Restart driver
             self.setup_driver()
             self.session_restarts += 1
             
-            print(f"✅ Browser session recovered (restart #{self.session_restarts})")
+            logger.info("✅ Browser session recovered (restart #%s)", self.session_restarts)
             return True
             
         except Exception as e:
-            print(f"❌ Browser session recovery failed: {e}")
+            logger.error("❌ Browser session recovery failed: %s", e)
+            return False
+    
+    def _reset_tab(self) -> bool:
+        """
+        Navigate the current tab to about:blank and probe it again. This revives a wedged
+        renderer in well under a second while the session itself is still alive.
+        """
+        if not self.driver:
+            return False
+        try:
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": "about:blank"})
+        except Exception as e:
+            logger.debug("Tab reset failed: %s", e)
             return False
+        self._last_health_check = 0.0
+        return self._is_browser_connected()
     
     def extract_business_data(self, business_url: str) -> Optional[Dict]:
         """
         Extracts detailed business data from its Google Maps page with structured logging.
         """
-        # Updated CID extraction to handle new Google Maps URL format
-        cid = None
-        # First, try to extract the CID from the 'data' parameter in the URL
-        fid_match = re.search(r'!1s0x[a-f0-9]+:0x([a-f0-9]+)', business_url, re.IGNORECASE)
-        if fid_match:
-            hex_cid = fid_match.group(1)
-            cid = str(int(hex_cid, 16))
-        else:
-            # If the new format is not found, fall back to the classic 'cid=' parameter
-            cid_match = re.search(r'cid=(\d+)', business_url)
-            if cid_match:
-                cid = cid_match.group(1)
+        if not self._claim_business(business_url):
+            return None
+        try:
+            return self._extract_page(business_url)
+        except _SoftBlocked:
+            self._handle_soft_block()
+            return None
 
-        # Use the extracted CID for duplicate checking, or the full URL as a fallback
-        unique_identifier = cid if cid else business_url
+    def extract_business_data_batch(self, business_urls: List[str]) -> List[Dict]:
+        """
+        Extracts several businesses at once, overlapping page loads across this scraper's
+        browser pool (workers > 1) or its tabs (tabs > 1). Duplicates and failures are skipped.
+        """
+        business_data, _ = self._extract_listed(business_urls, retry_on_failure=True)
+        return business_data
+
+    def _claim_business(self, business_url: str) -> bool:
+        """Mark a business as visited by CID; returns False if it was already seen."""
+        unique_identifier, has_cid = self._business_key(business_url)
         if unique_identifier in self.visited_cids:
-            print(f"⏭️ Skipping duplicate business (Identifier: {unique_identifier})")
-            return None
+            logger.info("⏭️ Skipping duplicate business (Identifier: %s)", unique_identifier)
+            return False
         self.visited_cids.add(unique_identifier)
 
-        if not cid:
-            print("⚠️ Could not extract CID from URL. Using full URL for uniqueness check.")
+        if not has_cid:
+            logger.warning("⚠️ Could not extract CID from URL. Using full URL for uniqueness check.")
+        return True
+
+    def _business_key(self, business_url: str) -> Tuple[str, bool]:
+        """Return the identifier a business is deduplicated and cached under, and whether it is a CID."""
+        # One scan finds either URL format; the hex form is the same CID in base 16
+        cid = None
+        cid_match = _CID_RE.search(business_url)
+        if cid_match:
+            hex_cid, cid = cid_match.groups()
+            if hex_cid:
+                cid = str(int(hex_cid, 16))
+
+        # Use the extracted CID for duplicate checking, or the full URL as a fallback
+        return (cid, True) if cid else (_normalize_place_url(business_url), False)
+
+    def _lookup_cache(self, business_url: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Check the persistent cache for this business. Returns (hit, data): a hit with data is
+        a recent extraction, a hit without data a page that recently held no business.
+        """
+        if not self._cache or self.force_rescrape:
+            return False, None
+        key = self._business_key(business_url)[0]
+        try:
+            business_data = self._cache.get(key)
+            if business_data:
+                logger.info("💾 Using cached data for %s", business_data.get('name'))
+                return True, business_data
+            if self._cache.failed_recently(key):
+                logger.info("⏭️ Skipping %s, it had no business data on a recent run", business_url)
+                return True, None
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Business cache read failed: %s", e)
+        return False, None
+
+    def _remember_business(self, business_url: str, business_data: Optional[Dict]):
+        """Store freshly extracted business data in the persistent cache."""
+        if not self._cache or not business_data:
+            return
+        try:
+            self._cache.set(self._business_key(business_url)[0], business_data)
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Business cache write failed: %s", e)
+
+    def _remember_failure(self, business_url: str):
+        """Record in the persistent cache that this business page held no usable data."""
+        if not self._cache:
+            return
+        try:
+            self._cache.mark_failed(self._business_key(business_url)[0])
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Business cache write failed: %s", e)
+
+    def _extract_page(self, business_url: str) -> Optional[Dict]:
+        """Loads a business page in this scraper's browser and extracts its fields."""
+        hit, business_data = self._lookup_cache(business_url)
+        if hit:
+            return business_data
+        return self._load_page(business_url)
 
+    def _load_page(self, business_url: str, try_http: bool = True) -> Optional[Dict]:
+        """
+        Fetches and extracts a business without consulting the cache, then caches the result.
+        try_http=False skips the HTTP fast path for listings _prefetch_http already tried.
+        """
+        if self.http_first and try_http:
+            business_data = self._try_http_extract(business_url)
+            if business_data:
+                self._remember_business(business_url, business_data)
+                return business_data
+        
         # Navigate to business page
-        self.driver.get(business_url)
+        self._pace()
+        # Navigate over CDP rather than driver.get: the command returns once the new document
+        # commits, so the header wait in _read_page bounds each business instead of the
+        # page-load timeout waiting on map tiles and third-party assets
+        result = self.driver.execute_cdp_cmd("Page.navigate", {"url": business_url})
+        if result.get("errorText"):
+            logger.warning("⚠️ Navigation to %s failed: %s", business_url, result["errorText"])
+            return None
+        business_data = self._read_page(business_url)
+        self._remember_business(business_url, business_data)
+        return business_data
+
+    def _pace(self):
+        """Wait for the rate limiter before a business page load, if pacing is configured."""
+        if self._limiter:
+            self._limiter.acquire()
+
+    def _handle_soft_block(self) -> bool:
+        """
+        Back off exponentially and restart the browser after Google served a captcha page.
+        Returns False if a stop arrived during the back-off or the restart budget is spent.
+        Tabs and window handles from before the call are gone once it returns True.
+        """
+        delay = min(2 ** self._block_backoff, 60)
+        self._block_backoff += 1
+        logger.warning("🚧 Google served a captcha page; backing off %ss and restarting the browser", delay)
+        if not self._sleep_unless_stopped(delay):
+            return False
+        # A fresh browser, not just a fresh tab: the block is tied to the session
+        return self._recover_browser_session(relaunch=True)
+
+    def _sleep_unless_stopped(self, delay: float) -> bool:
+        """Sleep for delay seconds, waking early on a stop request. False if stopped."""
+        deadline = time.monotonic() + delay
+        event = self.stop_event or self._stream_abandoned
+        while not self._stop_requested():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            # Short slices so an abandoned stream is noticed even while waiting on stop_event
+            event.wait(min(remaining, 0.5))
+        return False
+
+    def _evaluate(self, expression: str):
+        """
+        Evaluate a JavaScript expression in the current tab via CDP and return its value.
+        returnByValue serializes the result as JSON, so no element handles cross the wire.
+        A script running past SCRIPT_TIMEOUT_MS is terminated and reported as an error.
+        """
+        response = self.driver.execute_cdp_cmd(
+            "Runtime.evaluate", {"expression": expression, "returnByValue": True, "awaitPromise": False,
+                                 "timeout": SCRIPT_TIMEOUT_MS}
+        )
+        if "exceptionDetails" in response:
+            raise WebDriverException(f"Script error: {response['exceptionDetails'].get('text')}")
+        return response.get("result", {}).get("value")
+
+    def _http_session(self) -> "requests.Session":
+        """HTTP session shared by all scrapers, reusing keep-alive connections across requests."""
+        return _get_http_session()
+    
+    def _try_http_listings(self, keyword: str, city: str, max_listings: int) -> List[str]:
+        """
+        Collect listing URLs from the server-rendered search page without the browser.
+        Returns an empty list unless at least max_listings businesses were found, so that
+        short result sets still go through the browser's scrolling feed.
+        """
+        import requests
         
-        # Scroll to load lazy content
+        query = f"{keyword} in {city}".replace(" ", "+")
         try:
-            scrollable_panel = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='main']"))
+            response = self._http_session().get(
+                f"https://www.google.com/maps/search/{query}", params={"hl": "en", "gl": "us"}, timeout=10
             )
-            for _ in range(3):  # Scroll a few times to be sure
-                self.driver.execute_script("arguments[0].scrollTop += 500;", scrollable_panel)
-                time.sleep(0.5)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("⚠️ HTTP search failed, using browser: %s", e)
+            return []
+        
+        body = response.text.replace("\\u003d", "=").replace("\\u0026", "&")
+        seen = set()
+        business_urls = []
+        for match in _PLACE_URL_RE.finditer(body):
+            href = unescape(match.group(0))
+            if href.startswith("/"):
+                href = "https://www.google.com" + href
+            if href not in seen:
+                seen.add(href)
+                business_urls.append(href)
+                if len(business_urls) >= max_listings:
+                    logger.info("📍 Found %s business listings over HTTP", len(business_urls))
+                    return business_urls
+        
+        logger.info("📍 HTTP search found %s of %s listings, using browser", len(business_urls), max_listings)
+        return []
+    
+    def _try_http_extract(self, business_url: str) -> Optional[Dict]:
+        """
+        Extract a business from the server-rendered place page without the browser.
+        Only businesses with a real website are accepted here: they are disqualified as
+        leads regardless of their description, so nothing the browser would add changes
+        the outcome. Anything else returns None and is rendered with Selenium.
+        """
+        import requests
+        
+        try:
+            response = self._http_session().get(business_url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("⚠️ HTTP fetch failed, using browser: %s", e)
+            return None
+        
+        html = response.text
+        title_match = _HTTP_TITLE_RE.search(html)
+        state_match = _APP_STATE_RE.search(html)
+        if not title_match or not state_match:
+            return None
+        
+        # og:title reads "Name · Address"
+        name, _, address = unescape(title_match.group(1)).partition(" · ")
+        state = state_match.group(1).replace("\\u003d", "=").replace("\\u0026", "&")
+        website_match = _REDIRECT_URL_RE.search(state)
+        website = unquote(website_match.group(1)) if website_match else None
+        
+        if not name or not self._is_valid_website(website) or self._classify_website(website) != 'real_website':
+            return None
+        
+        phone_match = _PHONE_RE.search(state)
+        return {
+            "name": name.strip(),
+            "phone": self._clean_phone(phone_match.group(0)) if phone_match else "N/A",
+            "address": self._clean_address(address) if address else "N/A",
+            "website": website,
+            "website_type": "real_website",
+            "description": "",
+            "url": business_url
+        }
+
+    def _read_page(self, business_url: str) -> Optional[Dict]:
+        """Extracts business fields from the page loaded in the current tab."""
+        # Wait for the business header before reading anything
+        try:
+            self.wait.until(EC.presence_of_element_located(BUSINESS_HEADER_LOCATOR))
+            # The panel is rendered; stop map tiles and beacons still loading in the background
+            self.driver.execute_cdp_cmd("Page.stopLoading", {})
         except TimeoutException:
-            print("⚠️ Could not find scrollable panel for lazy loading.")
+            logger.warning("⚠️ Business header did not appear in time.")
+        except WebDriverException as e:
+            self._note_driver_error(e)
 
-        # Robust data extraction with fallbacks
-        name = self._get_element_text(By.CSS_SELECTOR, "h1.DUwDvf")
-        phone = self._get_element_text(By.CSS_SELECTOR, "button[data-item-id^='phone'] div.rogA2c")
-        address = self._get_element_text(By.CSS_SELECTOR, "button[data-item-id='address'] div.rogA2c")
-        website = self._get_element_attribute(By.CSS_SELECTOR, "a[data-item-id='authority']", "href")
+        # Scroll the panel and read every field, description included, in a single round-trip
+        try:
+            fields = self._evaluate(EXTRACT_FIELDS_JS) or {}
+        except WebDriverException as e:
+            logger.warning("⚠️ Batched field extraction failed: %s", e)
+            self._note_driver_error(e)
+            fields = {}
+        name = fields.get("name")
+        phone = fields.get("phone")
+        address = fields.get("address")
+        website = fields.get("website")
         
-        # Extract business description (crucial for finding Instagram links)
-        description = self._extract_business_description()
-
-        # Fallback for website if authority link is not found
-        if not website:
-            website = self._get_element_attribute(By.CSS_SELECTOR, "a[aria-label^='Website:']", "href")
+        # Business description (crucial for finding Instagram links)
+        description = self._build_description(fields.get("description") or [])
             
+        # A captcha interstitial means we're being rate limited, not that selectors broke
+        if fields.get("blocked"):
+            raise _SoftBlocked(f"captcha page served for {business_url}")
+        
         # Log failure if name is missing (critical field)
         if not name:
             failure_log = {
@@ -565,7 +1633,9 @@ class GoogleMapsScraper:
                 "html_snapshot": self.driver.page_source[:1000]  # Snippet of HTML
             }
             self.extraction_failures.append(failure_log)
-            print(f"❌ Failed to extract critical data (name) for {business_url}")
+            if fields.get("loaded"):
+                self._remember_failure(business_url)
+            logger.error("❌ Failed to extract critical data (name) for %s", business_url)
             return None
 
         # Clean and validate data
@@ -584,63 +1654,16 @@ class GoogleMapsScraper:
             "url": business_url
         }
 
+        self._block_backoff = 0
         return business_data
 
-    def _extract_business_description(self) -> str:
-        """Extract business description from various sources on the page."""
-        description_parts = []
-        
-        try:
-            # Try to find description in the main content area
-            description_selectors = [
-                ".PYvSYb",  # Main description area
-                ".lMbq3e",  # Alternative description
-                ".fontBodyMedium .PYvSYb",  # Specific description format
-                "[data-attrid='description']",  # Description attribute
-                ".Io6YTe",  # Review snippets that might contain Instagram info
-                ".MyEned",  # Additional content areas
-                ".fontBodyMedium span",  # General text spans
-            ]
-            
-            for selector in description_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 10:  # Only meaningful text
-                            description_parts.append(text)
-                except:
-                    continue
-            
-            # Also check for any text that might contain Instagram mentions
-            try:
-                # Look for any text containing @ symbols (potential Instagram handles)
-                at_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '@')]")
-                for element in at_elements:
-                    text = element.text.strip()
-                    if text and '@' in text:
-                        description_parts.append(text)
-            except:
-                pass
-            
-            # Look for Instagram-specific text patterns
-            try:
-                instagram_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'instagram') or contains(text(), 'Instagram') or contains(text(), 'IG') or contains(text(), 'ig')]")
-                for element in instagram_elements:
-                    text = element.text.strip()
-                    if text and len(text) < 200:  # Avoid huge blocks
-                        description_parts.append(text)
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"⚠️ Error extracting description: {e}")
-        
+    def _build_description(self, description_parts: List[str]) -> str:
+        """Join the description texts collected in-page into one cleaned, length-capped string."""
         # Combine all parts and clean up
         full_description = " ".join(description_parts)
         
         # Clean up the description
-        full_description = re.sub(r'\s+', ' ', full_description)  # Multiple spaces to single
+        full_description = _WHITESPACE_RE.sub(' ', full_description)  # Multiple spaces to single
         full_description = full_description.strip()
         
         # Limit length to avoid excessive data
@@ -662,17 +1685,9 @@ class GoogleMapsScraper:
         if not url:
             return False
             
-        # Exclude Google services and common non-website links
-        excluded_domains = [
-            'google.com', 'maps.google.com', 'facebook.com', 'instagram.com',
-            'twitter.com', 'youtube.com', 'tiktok.com', 'linkedin.com'
-        ]
-        
-        for domain in excluded_domains:
-            if domain in url.lower():
-                return False
-                
-        return True
+        # Match on the host only, so a path or query mentioning google.com doesn't exclude a real site
+        host = _url_host(url)
+        return not (_host_in(host, _EXCLUDED) or _is_google_host(host))
 
     def _is_squarespace_hosted(self, url: str) -> bool:
         """
@@ -687,23 +1702,442 @@ class GoogleMapsScraper:
         if not url:
             return False
             
-        # Common Squarespace subdomains and domains
-        squarespace_domains = [
-            'squarespace.com', 'squarespace.net', 'squarespace.org',
-            'squarespace.io', 'squarespace.co', 'squarespace.me',
-            'squarespace.app', 'squarespace.dev', 'squarespace.test',
-            'squarespace.local', 'squarespace.test', 'squarespace.dev'
-        ]
+        # Match on the host only, so a link merely mentioning squarespace.com isn't counted
+        return _host_in(_url_host(url), _SQUARESPACE_DOMAINS)
+    
+    def _report_business(self, business_data: Dict):
+        """Record a finished business for this run and hand it to the streaming consumer, if any."""
+        self._completed.append(business_data)
+        if self._on_business:
+            self._on_business(business_data)
+    
+    def _partition_listings(self, business_urls: List[str],
+                            limit: Optional[int] = None) -> Tuple[List[Dict], List[str], int]:
+        """
+        Sort listings before extraction. Returns the businesses served from the cache, the URLs
+        that still need a page load, and how many were skipped as duplicates or known dead pages.
+        Stops once limit businesses are cached or pending, so spare listings replace duplicates.
+        """
+        cached = []
+        pending = []
+        skipped = 0
+        for url in business_urls:
+            if limit is not None and len(cached) + len(pending) >= limit:
+                break
+            if not self._claim_business(url):
+                skipped += 1
+                continue
+            hit, business_data = self._lookup_cache(url)
+            if business_data:
+                cached.append(business_data)
+                self._report_business(business_data)
+            elif hit:
+                skipped += 1
+            else:
+                pending.append(url)
+        if self.http_first and pending:
+            fetched, pending = self._prefetch_http(pending)
+            cached.extend(fetched)
+        return cached, pending, skipped
+    
+    def _prefetch_http(self, business_urls: List[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Try the HTTP fast path for all listings at once instead of one before each page load.
+        The fetches are plain GETs on the shared keep-alive session, so they overlap freely.
+        Returns the businesses read over HTTP and the listings that still need the browser.
+        """
+        with ThreadPoolExecutor(max_workers=min(len(business_urls), MAX_WORKERS * 2)) as executor:
+            results = list(executor.map(self._try_http_extract, business_urls))
         
-        for domain in squarespace_domains:
-            if domain in url.lower():
-                return True
+        fetched = []
+        remaining = []
+        for url, business_data in zip(business_urls, results):
+            if business_data:
+                self._remember_business(url, business_data)
+                self._report_business(business_data)
+                fetched.append(business_data)
+            else:
+                remaining.append(url)
+        if fetched:
+            logger.info("⚡ Read %s businesses over HTTP, %s left for the browser", len(fetched), len(remaining))
+        return fetched, remaining
+    
+    def _extract_sequential(self, business_urls: List[str], retry_on_failure: bool,
+                            limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """Extract businesses one at a time with this scraper's browser."""
+        # Cached and duplicate listings never reach the loop, its health checks or its back-off
+        all_business_data, pending, failed_extractions = self._partition_listings(business_urls, limit)
+        total = len(pending)
+        percent = 100.0 / total if total else 0.0
+        
+        # A deque rather than a plain for loop, so a business interrupted by a session restart
+        # can be put back at the front and actually retried
+        remaining = deque(enumerate(pending, 1))
+        retried = set()
+        while remaining:
+            i, url = remaining.popleft()
+            if self._stop_requested():
+                logger.info("⏹️ Stop requested - ending scrape early")
+                break
+            
+            logger.info("\n📊 Processing %d/%d - %.1f%%", i, total, i * percent)
+            
+            # Enhanced connectivity check with recovery
+            if not self._is_browser_connected():
+                logger.error("❌ Browser disconnected during data extraction.")
+                self.consecutive_failures += 1
                 
-        return False
+                if self.consecutive_failures >= self.max_consecutive_failures:
+                    logger.error("❌ Too many consecutive failures (%s)", self.consecutive_failures)
+                    if retry_on_failure and self.session_restarts < self.max_session_restarts:
+                        logger.info("🔄 Attempting to restart browser session...")
+                        if self._recover_browser_session():
+                            self.consecutive_failures = 0
+                            if not self._requeue(remaining, retried, i, url):
+                                failed_extractions += 1
+                            continue
+                        else:
+                            logger.error("❌ Failed to restart browser session")
+                            break
+                    else:
+                        logger.error("❌ Maximum retries reached or retry disabled")
+                        break
+                else:
+                    logger.info("🔄 Attempting quick recovery (failure %s/%s)...", self.consecutive_failures, self.max_consecutive_failures)
+                    if self._recover_browser_session():
+                        self.consecutive_failures = 0
+                        if not self._requeue(remaining, retried, i, url):
+                            failed_extractions += 1
+                        continue
+                    else:
+                        failed_extractions += 1
+                        logger.warning("⚠️ Failed to extract data from business %s", i)
+                        continue
+            
+            started = time.perf_counter()
+            try:
+                business_data = self._load_page(url, try_http=False)
+            except _SoftBlocked:
+                if not self._handle_soft_block():
+                    logger.error("❌ Could not get past the captcha page; ending scrape early")
+                    failed_extractions += 1
+                    break
+                if not self._requeue(remaining, retried, i, url):
+                    failed_extractions += 1
+                continue
+            except WebDriverException as e:
+                logger.warning("⚠️ Extraction error for %s: %s", url, e)
+                self._note_driver_error(e)
+                business_data = None
+            if business_data:
+                all_business_data.append(business_data)
+                self._report_business(business_data)
+                logger.info("✅ %s", business_data['name'])
+                self.consecutive_failures = 0  # Reset on success
+            else:
+                failed_extractions += 1
+                self.consecutive_failures += 1
+                # A failure is the best hint the session may be gone: probe before the next page
+                # instead of trusting the cached health flag
+                self._last_health_check = 0.0
+                logger.warning("⚠️ Failed to extract data from business %s", i)
+            
+            # Back off only while extractions are failing; page readiness is handled by explicit waits.
+            # The back-off is a minimum gap between page starts, so a slow failure already paid for it
+            if self.consecutive_failures > 0:
+                delay = min(0.5 + (self.consecutive_failures * 0.2), 2.0) - (time.perf_counter() - started)
+                if delay > 0:
+                    logger.debug("⏱️ Waiting %.1fs before next extraction...", delay)
+                    time.sleep(delay)
+        
+        return all_business_data, failed_extractions
+    
+    def _requeue(self, remaining: deque, retried: set, i: int, url: str) -> bool:
+        """Put a business back at the front of the queue once; False if it was already retried."""
+        if i in retried:
+            logger.warning("⚠️ Giving up on business %s after a second session failure", i)
+            return False
+        retried.add(i)
+        remaining.appendleft((i, url))
+        return True
+    
+    def _open_tabs(self) -> List[str]:
+        """
+        Return handles for self.tabs browser tabs, opening blank ones as needed.
+        Extra tabs stay open after a run so the next search reuses them warm.
+        """
+        handles = self.driver.window_handles
+        if len(handles) < self.tabs:
+            current = self.driver.current_window_handle
+            for _ in range(self.tabs - len(handles)):
+                # new_window returns the handle directly and isn't subject to popup blocking
+                self.driver.switch_to.new_window('tab')
+                self._prepare_tab()
+                handles.append(self.driver.current_window_handle)
+            self.driver.switch_to.window(current)
+        return handles[:self.tabs]
+    
+    def _start_navigation(self, handle: str, url: str):
+        """Start loading url in the given tab without waiting for the page."""
+        self.driver.switch_to.window(handle)
+        # Blank the tab first so a stale business header can't satisfy the next wait
+        self.driver.get("about:blank")
+        self._pace()
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+    
+    def _extract_tabbed(self, business_urls: List[str], limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """
+        Extract businesses with one browser, keeping the next pages loading in other tabs
+        while the current one is read. WebDriver commands still run one at a time.
+        """
+        all_business_data, pending, failed_extractions = self._partition_listings(business_urls, limit)
+        cached_count = len(all_business_data)
+        if not pending:
+            return all_business_data, failed_extractions
+        
+        handles = self._open_tabs()
+        logger.info("🗂️ Pipelining page loads across %s tabs", len(handles))
+        for handle, url in zip(handles, pending):
+            self._start_navigation(handle, url)
+        
+        total = len(pending)
+        percent = 100.0 / total
+        blocked_retried = set()
+        i = 0
+        while i < total:
+            url = pending[i]
+            if self._stop_requested():
+                logger.info("⏹️ Stop requested - ending scrape early")
+                break
+            
+            logger.info("\n📊 Processing %d/%d - %.1f%%", i + 1, total, (i + 1) * percent)
+            
+            if not self._is_browser_connected():
+                logger.error("❌ Browser disconnected during data extraction.")
+                break
+            
+            handle = handles[i % len(handles)]
+            try:
+                self.driver.switch_to.window(handle)
+                business_data = self._read_page(url)
+                self._remember_business(url, business_data)
+            except _SoftBlocked:
+                # The relaunch replaces every tab, so the handles and their in-flight loads are gone
+                if i in blocked_retried or not self._handle_soft_block():
+                    logger.error("❌ Could not get past the captcha page; ending scrape early")
+                    break
+                blocked_retried.add(i)
+                handles = self._open_tabs()
+                for k in range(i, min(i + len(handles), total)):
+                    self._start_navigation(handles[k % len(handles)], pending[k])
+                continue
+            except Exception as e:
+                logger.warning("⚠️ Extraction error for %s: %s", url, e)
+                self._note_driver_error(e)
+                business_data = None
+            
+            # Queue the next page into the tab that just freed up
+            next_index = i + len(handles)
+            if next_index < total:
+                try:
+                    self._start_navigation(handle, pending[next_index])
+                except Exception as e:
+                    logger.warning("⚠️ Could not start loading %s: %s", pending[next_index], e)
+                    self._note_driver_error(e)
+            
+            if business_data:
+                all_business_data.append(business_data)
+                self._report_business(business_data)
+                logger.info("✅ %s", business_data['name'])
+            else:
+                logger.warning("⚠️ Failed to extract data from business %s", i + 1)
+            i += 1
+        
+        try:
+            if self.driver:
+                self.driver.switch_to.window(handles[0])
+        except WebDriverException:
+            pass
+        
+        failed_extractions += total - (len(all_business_data) - cached_count)
+        return all_business_data, failed_extractions
+    
+    def _get_pool(self) -> DriverPool:
+        """Return the extraction pool, starting extra browsers until it holds self.workers scrapers."""
+        if self._pool is None:
+            self._pool = DriverPool()
+            self._owns_pool = True
+        if not self._in_pool:
+            # This scraper stays checked out while it drives its own browser (searching, sequential
+            # extraction, validation); it is only lent to the pool around parallel extraction, so a
+            # shared pool never hands it to another thread mid-use
+            self._pool.add(self, owned=False, idle=False)
+            self._in_pool = True
+        
+        missing = self.workers - self._pool.size
+        if missing > 0:
+            logger.info("🚀 Starting %s additional browser(s) for parallel extraction...", missing)
+            
+            def start_worker(_):
+                try:
+                    return GoogleMapsScraper(headless=self.headless, stop_event=self.stop_event,
+                                             http_first=self.http_first,
+                                             persistent_profile=self.persistent_profile,
+                                             delay_between_requests=self.delay_between_requests,
+                                             use_cache=self.use_cache, grid_url=self.grid_url)
+                except Exception as e:
+                    logger.warning("⚠️ Could not start extraction worker: %s", e)
+                    return None
+            
+            # Resolve chromedriver before fanning out so workers don't all wait on the download check
+            if not self.grid_url:
+                _get_driver_path()
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                for worker in executor.map(start_worker, range(missing)):
+                    if worker:
+                        # Share failure reporting and the request rate with the parent scraper
+                        worker.extraction_failures = self.extraction_failures
+                        worker._limiter = self._limiter
+                        self._pool.add(worker)
+        
+        return self._pool
+    
+    def _extract_on_pool(self, pool: DriverPool, url: str, try_http: bool = True) -> Optional[Dict]:
+        """Extract one uncached business with whichever pooled browser is free next."""
+        self._concurrency.acquire()
+        worker = pool.get()
+        # Errors and captcha pages mean too much load; a dead listing doesn't
+        congested = False
+        try:
+            if self._stop_requested():
+                return None
+            if not worker._is_browser_connected() and not worker._recover_browser_session():
+                congested = True
+                return None
+            return worker._load_page(url, try_http)
+        except _SoftBlocked:
+            congested = True
+            worker._handle_soft_block()
+            return None
+        except Exception as e:
+            logger.warning("⚠️ Extraction error for %s: %s", url, e)
+            worker._note_driver_error(e)
+            congested = True
+            return None
+        finally:
+            pool.release(worker)
+            self._concurrency.release(congested)
+    
+    def _collect_results(self, futures: List[Future]) -> Tuple[List[Dict], int]:
+        """
+        Report extractions as they finish, so one slow page doesn't hold back progress.
+        Returns the data in listing order and the failure count.
+        """
+        total = len(futures)
+        percent = 100.0 / total if total else 0.0
+        positions = {future: i for i, future in enumerate(futures)}
+        results = [None] * total
+        failed_extractions = 0
+        for done, future in enumerate(as_completed(futures), 1):
+            i = positions[future]
+            business_data = results[i] = future.result()
+            logger.info("\n📊 Processing %d/%d - %.1f%%", done, total, done * percent)
+            if business_data:
+                self._report_business(business_data)
+                logger.info("✅ %s", business_data['name'])
+            else:
+                failed_extractions += 1
+                logger.warning("⚠️ Failed to extract data from business %s", i + 1)
+        return [business_data for business_data in results if business_data], failed_extractions
+    
+    def _extract_listed(self, business_urls: List[str], retry_on_failure: bool,
+                        limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """
+        Extract an already collected list of businesses with the configured strategy,
+        up to limit of them when given.
+        """
+        if self.workers > 1:
+            return self._extract_parallel(business_urls, limit)
+        if self.tabs > 1:
+            return self._extract_tabbed(business_urls, limit)
+        return self._extract_sequential(business_urls, retry_on_failure, limit)
+    
+    def _extract_parallel(self, business_urls: List[str], limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """Extract an already collected list of businesses across the browser pool."""
+        # Duplicate filtering happens up front so workers never race on visited_cids
+        cached, pending, failed_extractions = self._partition_listings(business_urls, limit)
+        if not pending:
+            return cached, failed_extractions
+        
+        pool = self._get_pool()
+        self._concurrency = AdaptiveConcurrency(pool.size)
+        logger.info("⚡ Extracting with %s parallel browser(s)", pool.size)
+        pool.release(self)
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                # Listings reaching the pool were already tried over HTTP by _partition_listings
+                futures = [executor.submit(self._extract_on_pool, pool, url, False) for url in pending]
+                all_business_data, failed = self._collect_results(futures)
+        finally:
+            pool.acquire(self)
+        
+        return cached + all_business_data, failed_extractions + failed
+    
+    def _scrape_pipelined(self, max_businesses: int) -> Tuple[List[str], List[Dict], int]:
+        """
+        Collect listings and extract them at the same time: this browser keeps scrolling
+        the results feed while the other pooled browsers extract each listing as it appears.
+        This browser joins the extractors once scrolling is done and is taken back at the end.
+        """
+        pool = self._get_pool()
+        self._concurrency = AdaptiveConcurrency(pool.size)
+        logger.info("⚡ Extracting with %s parallel browser(s) while scrolling results", pool.size)
+        
+        business_urls = []
+        futures = []
+        failed_extractions = 0
+        executor = ThreadPoolExecutor(max_workers=pool.size)
+        
+        def submit(url: str):
+            nonlocal failed_extractions
+            # Duplicates don't use up a slot: stop once max_businesses distinct ones are queued
+            if len(futures) >= max_businesses:
+                return
+            business_urls.append(url)
+            if not self._claim_business(url):
+                failed_extractions += 1
+                return
+            hit, business_data = self._lookup_cache(url)
+            if hit:
+                # Already settled: report it with the rest without occupying a browser
+                future = Future()
+                future.set_result(business_data)
+                futures.append(future)
+            else:
+                futures.append(executor.submit(self._extract_on_pool, pool, url))
+        
+        try:
+            self._on_listing = submit
+            try:
+                self.get_business_listings(max_businesses)
+            finally:
+                self._on_listing = None
+                pool.release(self)
+            
+            if business_urls:
+                logger.info("📍 Processing %s businesses...", len(business_urls))
+            all_business_data, failed = self._collect_results(futures)
+        finally:
+            executor.shutdown(wait=True)
+            pool.acquire(self)
+        
+        return business_urls, all_business_data, failed_extractions + failed
     
     def scrape_businesses(self, keyword: str, city: str, max_businesses: int = 50, retry_on_failure: bool = True) -> List[Dict]:
         """
-        Optimized scraping workflow with enhanced speed and reliability.
+        Optimized scraping workflow with enhanced speed and reliability. Each call is a
+        separate search: businesses returned by earlier searches on this scraper are
+        returned again rather than skipped as duplicates.
         
         Args:
             keyword (str): Business type to search for
@@ -714,124 +2148,196 @@ class GoogleMapsScraper:
         Returns:
             List[Dict]: List of business data dictionaries
         """
-        print(f"🚀 Starting optimized scrape for '{keyword}' in '{city}'")
-        print(f"🔧 Configuration: max_businesses={max_businesses}, retry_on_failure={retry_on_failure}")
+        self._begin_search()
+        return self._scrape_run(keyword, city, max_businesses, retry_on_failure)
+    
+    def _scrape_run(self, keyword: str, city: str, max_businesses: int, retry_on_failure: bool) -> List[Dict]:
+        """One scrape pass; businesses already claimed by the current search are skipped."""
+        logger.info("🚀 Starting optimized scrape for '%s' in '%s'", keyword, city)
+        logger.info("🔧 Configuration: max_businesses=%s, retry_on_failure=%s", max_businesses, retry_on_failure)
+        self._completed = []
         
         try:
-            # Step 1: Search Google Maps
-            if not self.search_google_maps(keyword, city):
-                print("❌ Failed to search Google Maps")
-                return []
+            # Steps 1-2 without the browser when the search page already lists enough businesses
+            business_urls = self._try_http_listings(keyword, city, max_businesses) if self.http_first else []
+            if business_urls:
+                logger.info("📍 Processing %s businesses...", len(business_urls))
+                all_business_data, failed_extractions = self._extract_listed(business_urls, retry_on_failure)
             
-            # Step 2: Get business listing URLs
-            business_urls = self.get_business_listings()
-            
-            if not business_urls:
-                print("❌ No business listings found")
+            # Step 1: Search Google Maps
+            elif not self.search_google_maps(keyword, city):
+                logger.error("❌ Failed to search Google Maps")
                 return []
             
-            # Limit to max_businesses
-            business_urls = business_urls[:max_businesses]
-            print(f"📍 Processing {len(business_urls)} businesses...")
-            
-            # Step 3: Extract data from each business with optimized processing
-            all_business_data = []
-            failed_extractions = 0
-            
-            for i, url in enumerate(business_urls, 1):
-                print(f"\n📊 Processing {i}/{len(business_urls)} - {(i/len(business_urls)*100):.1f}%")
+            elif self.workers > 1:
+                # Steps 2-3 overlap: listings are extracted while the feed is still scrolling
+                business_urls, all_business_data, failed_extractions = self._scrape_pipelined(max_businesses)
+                if not business_urls:
+                    logger.error("❌ No business listings found")
+                    return []
+            else:
+                # Step 2: Get business listing URLs
+                business_urls = self.get_business_listings(max_businesses)
                 
-                # Enhanced connectivity check with recovery
-                if not self._is_browser_connected():
-                    print("❌ Browser disconnected during data extraction.")
-                    self.consecutive_failures += 1
-                    
-                    if self.consecutive_failures >= self.max_consecutive_failures:
-                        print(f"❌ Too many consecutive failures ({self.consecutive_failures})")
-                        if retry_on_failure and self.session_restarts < self.max_session_restarts:
-                            print("🔄 Attempting to restart browser session...")
-                            if self._recover_browser_session():
-                                self.consecutive_failures = 0
-                                # Retry current business
-                                i -= 1
-                                continue
-                            else:
-                                print("❌ Failed to restart browser session")
-                                break
-                        else:
-                            print("❌ Maximum retries reached or retry disabled")
-                            break
-                    else:
-                        print(f"🔄 Attempting quick recovery (failure {self.consecutive_failures}/{self.max_consecutive_failures})...")
-                        if self._recover_browser_session():
-                            self.consecutive_failures = 0
-                            # Retry current business
-                            i -= 1
-                            continue
-                        else:
-                            failed_extractions += 1
-                            print(f"⚠️ Failed to extract data from business {i}")
-                            continue
+                if not business_urls:
+                    logger.error("❌ No business listings found")
+                    return []
                 
-                business_data = self.extract_business_data(url)
-                if business_data:
-                    all_business_data.append(business_data)
-                    print(f"✅ {business_data['name']}")
-                    self.consecutive_failures = 0  # Reset on success
-                else:
-                    failed_extractions += 1
-                    self.consecutive_failures += 1
-                    print(f"⚠️ Failed to extract data from business {i}")
+                # Limit to max_businesses; listings past the limit only stand in for duplicates
+                logger.info("📍 Processing %s businesses...", min(len(business_urls), max_businesses))
                 
-                # Progressive delay based on consecutive failures
-                if self.consecutive_failures > 0:
-                    delay = min(0.5 + (self.consecutive_failures * 0.2), 2.0)
-                    print(f"⏱️ Waiting {delay:.1f}s before next extraction...")
-                    time.sleep(delay)
-                else:
-                    time.sleep(0.3)  # Slightly increased base delay for stability
+                # Step 3: Extract data from each business with optimized processing
+                all_business_data, failed_extractions = self._extract_listed(business_urls, retry_on_failure,
+                                                                             max_businesses)
+                business_urls = business_urls[:max_businesses]
             
             # Summary
             success_rate = (len(all_business_data) / len(business_urls)) * 100 if business_urls else 0
-            print(f"\n✅ Scraping completed!")
-            print(f"📊 Successfully extracted: {len(all_business_data)}/{len(business_urls)} ({success_rate:.1f}%)")
+            logger.info("\n✅ Scraping completed!")
+            logger.info("📊 Successfully extracted: %s/%s (%.1f%%)", len(all_business_data), len(business_urls), success_rate)
             if failed_extractions > 0:
-                print(f"⚠️ Failed extractions: {failed_extractions}")
-            print(f"🔄 Session restarts: {self.session_restarts}")
+                logger.warning("⚠️ Failed extractions: %s", failed_extractions)
+            logger.info("🔄 Session restarts: %s", self.session_restarts)
             
             # Run validation pass on scraped data
-            self._run_validation_pass(all_business_data)
+            if not self._stop_requested():
+                self._run_validation_pass(all_business_data)
 
             # Report extraction failures
             if self.extraction_failures:
-                print("\n--- Extraction Failure Report ---")
-                print(f"Total failures: {len(self.extraction_failures)}")
+                logger.info("\n--- Extraction Failure Report ---")
+                logger.info("Total failures: %s", len(self.extraction_failures))
                 for failure in self.extraction_failures:
-                    print(f"URL: {failure['url']}, Missing: {failure['missing_fields']}")
-                print("---------------------------------")
+                    logger.info("URL: %s, Missing: %s", failure['url'], failure['missing_fields'])
+                logger.info("---------------------------------")
 
             return all_business_data
             
         except Exception as e:
-            print(f"❌ Scraping failed with error: {e}")
+            logger.error("❌ Scraping failed with error: %s", e)
+            self._note_driver_error(e)
             if retry_on_failure and self.session_restarts < self.max_session_restarts:
-                print("🔄 Attempting full retry...")
+                logger.info("🔄 Attempting full retry...")
+                # Keep what this run already finished: those businesses are claimed in visited_cids,
+                # so the retry skips them and only extracts the rest
+                partial = self._completed
                 try:
-                    self.close()
-                    self.setup_driver()
-                    self.session_restarts += 1
-                    return self.scrape_businesses(keyword, city, max_businesses, False)
+                    # Keep the warm browser unless its session is actually gone
+                    if not self._is_browser_connected() and not self._recover_browser_session():
+                        return partial
+                    if len(partial) >= max_businesses:
+                        return partial
+                    return partial + self._scrape_run(keyword, city, max_businesses - len(partial), False)
                 except Exception as retry_error:
-                    print(f"❌ Retry failed: {retry_error}")
-            return []
+                    logger.error("❌ Retry failed: %s", retry_error)
+                return partial
+            return self._completed
+    
+    def iter_businesses(self, keyword: str, city: str, max_businesses: int = 50) -> Iterator[Dict]:
+        """
+        Like scrape_businesses, but yields each business as soon as it is extracted so the
+        caller can persist it straight away. The scrape runs on a background thread and waits
+        once STREAM_QUEUE_SIZE businesses are unread; stopping the iteration early stops it.
+        """
+        finished = object()
+        businesses = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        abandoned = self._stream_abandoned
+        
+        def deliver(item):
+            # Wait for room, but give up once the consumer has gone away
+            while not abandoned.is_set():
+                try:
+                    businesses.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+        
+        def run():
+            self._on_business = deliver
+            try:
+                self.scrape_businesses(keyword, city, max_businesses)
+            finally:
+                self._on_business = None
+                deliver(finished)
+        
+        abandoned.clear()
+        thread = threading.Thread(target=run, name="scrape-stream", daemon=True)
+        thread.start()
+        try:
+            while True:
+                business_data = businesses.get()
+                if business_data is finished:
+                    return
+                yield business_data
+        finally:
+            # Stop the scrape at its next checkpoint, then wait for it: the browser is not
+            # safe to share, so it is never handed back while the scrape still runs
+            abandoned.set()
+            thread.join()
+            abandoned.clear()
+    
+    def scrape_to_jsonl(self, keyword: str, city: str, out_path: str, max_businesses: int = 50) -> int:
+        """
+        Append each business to a JSON Lines file as soon as it is extracted, so an interrupted
+        run keeps everything found so far. Returns how many businesses were written.
+        """
+        written = 0
+        with open(out_path, "a", encoding="utf-8") as f:
+            for business_data in self.iter_businesses(keyword, city, max_businesses):
+                f.write(json.dumps(business_data, ensure_ascii=False) + "\n")
+                f.flush()
+                written += 1
+        logger.info("💾 Wrote %s businesses to %s", written, out_path)
+        return written
+    
+    def scrape_many(self, queries: List[Tuple[str, str]], max_businesses: int = 50) -> List[Dict]:
+        """
+        Run several (keyword, city) searches with the same warm browser(s).
+        A business found by more than one search is only returned once.
+        """
+        self._begin_search()
+        all_business_data = []
+        for keyword, city in queries:
+            if self._stop_requested():
+                break
+            all_business_data.extend(self._scrape_run(keyword, city, max_businesses, True))
+        return all_business_data
+    
+    def _begin_search(self):
+        """Forget the previous search's duplicates and failures before a new one starts."""
+        self.visited_cids.clear()
+        self.extraction_failures.clear()
+    
+    def reset(self):
+        """
+        Forget per-search state so the next search starts fresh, keeping the browser open.
+        Cookies are kept: they hold Google's consent choice, which would otherwise be asked again.
+        """
+        self._begin_search()
+        self.consecutive_failures = 0
+        if self.driver:
+            try:
+                self.driver.get("about:blank")
+            except WebDriverException as e:
+                self._note_driver_error(e)
     
     def close(self):
         """Close the WebDriver and clean up resources."""
+        if self._pool:
+            pool, self._pool = self._pool, None
+            if self._in_pool:
+                pool.discard(self, checked_out_by_caller=True)
+                self._in_pool = False
+            # A shared pool outlives this scraper; only a pool it created is closed here
+            if self._owns_pool:
+                pool.close()
+        
         if self.driver:
             try:
                 self.driver.quit()
-                print("🔒 Browser closed")
+                logger.info("🔒 Browser closed")
             except:
-                print("🔒 Browser cleanup completed")
+                logger.info("🔒 Browser cleanup completed")
         self.driver = None
-        self.wait = None 
\ No newline at end of file
+        self.wait = None
+        self._release_profile() 
\ No newline at end of file